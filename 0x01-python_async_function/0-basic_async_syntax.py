@@ -15,9 +15,16 @@ Utilisation :
 
 import asyncio
 import random
+from typing import Any, Awaitable, Callable, Optional
+# Importe la source de délais par boucle du fichier 7-delay_source.py
+current_delay_source = __import__('7-delay_source').current_delay_source
+# Importe l'instrumentation optionnelle du fichier 12-instrumentation.py
+current_recorder = __import__('12-instrumentation').current_recorder
 
 
-async def wait_random(max_delay: int = 10) -> float:
+async def wait_random(max_delay: int = 10, source: Any = None,
+                      sleep: Optional[Callable[[float], Awaitable[Any]]]
+                      = None) -> float:
     """
     Coroutine asynchrone qui attend un délai
     aléatoire entre 0 et max_delay secondes.
@@ -25,13 +32,30 @@ async def wait_random(max_delay: int = 10) -> float:
     Args:
         max_delay (float): Nombre maximum de
         secondes à attendre (par défaut 10).
+        source (DelaySource): Source de délais à utiliser ; par
+        défaut celle associée à la boucle, sinon random.uniform.
+        sleep (Callable): Fonction de sommeil à utiliser, par
+        exemple wheel_sleep (par défaut asyncio.sleep).
 
     Returns:
         float: Le délai aléatoire qui a été attendu.
     """
+    if source is None:
+        source = current_delay_source()
     # Génère un délai aléatoire
-    valdelay = random.uniform(0, max_delay)
-    # Attend de manière asynchrone le délai
-    await asyncio.sleep(valdelay)
+    if source is None:
+        valdelay = random.uniform(0, max_delay)
+    else:
+        valdelay = source.draw(max_delay)
+    recorder = current_recorder()
+    if recorder is None:
+        # Attend de manière asynchrone le délai
+        await (sleep or asyncio.sleep)(valdelay)
+    else:
+        # Mesure le délai réellement obtenu sur l'horloge de la boucle
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await (sleep or asyncio.sleep)(valdelay)
+        recorder.record_wait('wait_random', valdelay, loop.time() - start)
     # Retourne le délai une fois complété
     return valdelay
@@ -5,12 +5,21 @@ attendre plusieurs délais aléatoires simultanément.
 """
 
 import asyncio
-from typing import List
+import functools
+import itertools
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
 # Importe la coroutine wait_random du fichier 0-basic_async_syntax.py
 wait_random = __import__('0-basic_async_syntax').wait_random
+# Importe l'ordonnanceur borné du fichier 5-bounded_scheduler.py
+bounded_as_completed = __import__('5-bounded_scheduler').bounded_as_completed
+# Importe l'instrumentation optionnelle du fichier 12-instrumentation.py
+timed = __import__('12-instrumentation').timed
 
 
-async def wait_n(n: int, max_delay: int) -> List[float]:
+async def wait_n(n: int, max_delay: int,
+                 max_in_flight: Optional[int] = None,
+                 sleep: Optional[Callable[[float], Awaitable[Any]]] = None
+                 ) -> List[float]:
     """
     Coroutine asynchrone qui appelle wait_random
     n fois avec un délai maximum spécifié
@@ -19,18 +28,82 @@ async def wait_n(n: int, max_delay: int) -> List[float]:
     Args:
         n (int): Nombre de fois où wait_random doit être appelé.
         max_delay (int): Délai maximum à passer à chaque appel de wait_random.
+        max_in_flight (Optional[int]): Si fourni, nombre maximum
+        d'appels en cours ; les coroutines sont alors créées
+        paresseusement au lieu d'être toutes allouées d'avance.
+        sleep (Callable): Fonction de sommeil passée à wait_random,
+        par exemple wheel_sleep pour un très grand nombre d'appels.
 
     Returns:
         List[float]: Liste des délais générés
         par wait_random, triés par ordre croissant.
     """
-    # Crée une liste de tâches à exécuter, où chaque tâche
-    # est une invocation de wait_random avec max_delay spécifié
-    valtasks = [wait_random(max_delay) for _ in range(n)]
+    with timed('wait_n.duration'):
+        if max_in_flight is not None:
+            # Pool de travailleurs borné alimenté par un itérateur paresseux
+            factories = itertools.repeat(
+                functools.partial(wait_random, max_delay, sleep=sleep), n)
+            valdelays = [valdelay async for valdelay in
+                         bounded_as_completed(factories, max_in_flight)]
+        else:
+            # Crée une liste de tâches à exécuter, où chaque tâche
+            # est une invocation de wait_random avec max_delay spécifié
+            valtasks = [wait_random(max_delay, sleep=sleep)
+                        for _ in range(n)]
 
-    # Exécute toutes les tâches de manière
-    # concurrente et attend leur achèvement
-    valdelays = await asyncio.gather(*valtasks)
+            # Exécute toutes les tâches de manière
+            # concurrente et attend leur achèvement
+            valdelays = await asyncio.gather(*valtasks)
 
     # Trie les délais générés par wait_random par ordre croissant
     return sorted(valdelays)
+
+
+async def wait_n_as_completed(
+        n: int, max_delay: int,
+        max_in_flight: Optional[int] = None) -> AsyncIterator[float]:
+    """
+    Itérateur asynchrone qui lance n appels à wait_random
+    et produit chaque délai dès que sa coroutine se termine.
+
+    Les délais arrivent dans l'ordre d'achèvement, qui n'est pas
+    l'ordre croissant : chaque sommeil démarre à un instant
+    différent, donc un délai plus court lancé plus tard peut finir
+    après un délai plus long, et cet écart grandit avec n. Avec
+    max_in_flight, l'ordre ne suit plus du tout les délais. Trier
+    le résultat si l'ordre croissant est nécessaire (comme wait_n).
+    Si l'itération est interrompue, les coroutines restantes sont
+    annulées.
+
+    Args:
+        n (int): Nombre de fois où wait_random doit être appelé.
+        max_delay (int): Délai maximum à passer
+        à chaque appel de wait_random.
+        max_in_flight (Optional[int]): Si fourni, nombre
+        maximum d'appels en cours à la fois.
+
+    Yields:
+        float: Chaque délai, dans l'ordre d'achèvement (non trié).
+    """
+    if max_in_flight is not None:
+        factories = itertools.repeat(
+            functools.partial(wait_random, max_delay), n)
+        valdelays = bounded_as_completed(factories, max_in_flight)
+        try:
+            async for valdelay in valdelays:
+                yield valdelay
+        finally:
+            # Ferme l'ordonnanceur tout de suite, sans attendre le
+            # ramasse-miettes, pour annuler ses travailleurs
+            await valdelays.aclose()
+        return
+    valtasks = [asyncio.ensure_future(wait_random(max_delay))
+                for _ in range(n)]
+    try:
+        for valdelay in asyncio.as_completed(valtasks):
+            yield await valdelay
+    finally:
+        # Annule les coroutines encore en cours si le consommateur s'arrête
+        for valtask in valtasks:
+            valtask.cancel()
+        await asyncio.gather(*valtasks, return_exceptions=True)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Module contenant des variantes de task_wait_n qui n'attendent
+pas toutes les tâches : les k premiers délais, ou tous ceux
+terminés avant une échéance. Les tâches restantes sont annulées
+et nettoyées avant le retour (requêtes « couvertes »).
+
+Utilisation :
+    task_wait_first_k = __import__('10-hedged_tasks').task_wait_first_k
+
+    print(asyncio.run(task_wait_first_k(100, 10, 3)))
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+# Importe la fonction task_wait_random du fichier 3-tasks.py
+task_wait_random = __import__('3-tasks').task_wait_random
+
+
+async def cancel_and_wait(tasks: Iterable[asyncio.Future]) -> None:
+    """
+    Annule les tâches non terminées et attend leur fin.
+
+    Args:
+        tasks (Iterable[asyncio.Future]): Tâches à nettoyer.
+    """
+    pending = [task for task in tasks if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def task_wait_first_k(
+        n: int, max_delay: int, k: int,
+        sleep: Optional[Callable[[float], Awaitable[Any]]] = None
+        ) -> List[float]:
+    """
+    Crée n tâches avec task_wait_random et retourne les k
+    premiers délais terminés, puis annule les autres tâches.
+
+    Args:
+        n (int): Nombre de tâches à créer.
+        max_delay (int): Délai maximum à passer à
+        chaque appel de task_wait_random.
+        k (int): Nombre de délais voulus.
+        sleep (Callable): Fonction de sommeil passée
+        à task_wait_random.
+
+    Returns:
+        List[float]: Les k premiers délais terminés, triés par ordre
+        croissant (moins de k si n < k). Ce ne sont pas forcément
+        les k plus petits : les tâches ne démarrent pas au même
+        instant.
+    """
+    tasks = [task_wait_random(max_delay, sleep) for _ in range(n)]
+    delays: List[float] = []
+    try:
+        if k > 0:
+            for delay in asyncio.as_completed(tasks):
+                delays.append(await delay)
+                if len(delays) >= k:
+                    break
+    finally:
+        await cancel_and_wait(tasks)
+    # L'ordre d'achèvement n'est pas l'ordre croissant
+    return sorted(delays)
+
+
+async def task_wait_deadline(
+        n: int, max_delay: int, timeout: float,
+        sleep: Optional[Callable[[float], Awaitable[Any]]] = None
+        ) -> List[float]:
+    """
+    Crée n tâches avec task_wait_random et retourne les délais
+    terminés avant timeout secondes, puis annule les autres tâches.
+
+    Args:
+        n (int): Nombre de tâches à créer.
+        max_delay (int): Délai maximum à passer à
+        chaque appel de task_wait_random.
+        timeout (float): Temps maximum d'attente, en secondes.
+        sleep (Callable): Fonction de sommeil passée
+        à task_wait_random.
+
+    Returns:
+        List[float]: Délais terminés à temps, triés par ordre croissant.
+    """
+    tasks = [task_wait_random(max_delay, sleep) for _ in range(n)]
+    if not tasks:
+        return []
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=timeout)
+    finally:
+        await cancel_and_wait(tasks)
+    return sorted(task.result() for task in done)
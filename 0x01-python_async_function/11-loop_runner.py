@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Module contenant un exécuteur qui garde une même boucle
+d'événements en vie entre plusieurs appels, et un registre
+de fabriques de boucles (asyncio, uvloop s'il est installé,
+horloge virtuelle).
+
+Utilisation :
+    LoopRunner = __import__('11-loop_runner').LoopRunner
+
+    with LoopRunner('uvloop') as runner:
+        for _ in range(100):
+            runner.run(wait_n(10, 0))
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+
+
+def _uvloop_factory() -> asyncio.AbstractEventLoop:
+    """
+    Crée une boucle uvloop.
+
+    Returns:
+        asyncio.AbstractEventLoop: La nouvelle boucle.
+    """
+    import uvloop
+    return uvloop.new_event_loop()
+
+
+def _virtual_factory() -> asyncio.AbstractEventLoop:
+    """
+    Crée une boucle à horloge virtuelle (6-virtual_clock.py).
+
+    Returns:
+        asyncio.AbstractEventLoop: La nouvelle boucle.
+    """
+    return __import__('6-virtual_clock').VirtualClockEventLoop()
+
+
+def available_loop_factories() -> Dict[str, LoopFactory]:
+    """
+    Liste les fabriques de boucles utilisables dans cet environnement.
+
+    Returns:
+        Dict[str, LoopFactory]: Fabriques indexées par nom.
+    """
+    factories: Dict[str, LoopFactory] = {
+        'asyncio': asyncio.new_event_loop,
+        'virtual': _virtual_factory,
+    }
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:  # uvloop est optionnel
+        pass
+    else:
+        factories['uvloop'] = _uvloop_factory
+    return factories
+
+
+def get_loop_factory(name: str) -> LoopFactory:
+    """
+    Retourne la fabrique de boucles portant ce nom.
+
+    Args:
+        name (str): 'asyncio', 'uvloop' ou 'virtual'.
+
+    Returns:
+        LoopFactory: La fabrique.
+
+    Raises:
+        ValueError: Si la fabrique est inconnue ou non installée.
+    """
+    factories = available_loop_factories()
+    if name not in factories:
+        raise ValueError("boucle indisponible : {} (choix : {})".format(
+            name, ', '.join(sorted(factories))))
+    return factories[name]
+
+
+class LoopRunner:
+    """
+    Exécute des coroutines sur une boucle créée une seule fois
+    et réutilisée jusqu'à close().
+    """
+
+    def __init__(self,
+                 loop_factory: Union[str, LoopFactory, None] = None) -> None:
+        """
+        Args:
+            loop_factory (Union[str, LoopFactory, None]): Nom ou
+            fabrique de la boucle, asyncio.new_event_loop par défaut.
+        """
+        if loop_factory is None:
+            loop_factory = asyncio.new_event_loop
+        elif isinstance(loop_factory, str):
+            loop_factory = get_loop_factory(loop_factory)
+        self._loop_factory = loop_factory
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __enter__(self) -> 'LoopRunner':
+        """Retourne l'exécuteur, la boucle étant créée au premier run."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Ferme la boucle en sortie de bloc."""
+        self.close()
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Retourne la boucle, en la créant au premier appel.
+
+        Returns:
+            asyncio.AbstractEventLoop: La boucle de l'exécuteur.
+
+        Raises:
+            RuntimeError: Si l'exécuteur est fermé.
+        """
+        if self._loop is None:
+            self._loop = self._loop_factory()
+        elif self._loop.is_closed():
+            raise RuntimeError("LoopRunner est fermé")
+        return self._loop
+
+    def run(self, main: Awaitable[Any]) -> Any:
+        """
+        Exécute une coroutine sur la boucle persistante.
+
+        Args:
+            main (Awaitable): Coroutine à exécuter.
+
+        Returns:
+            Any: Le résultat de la coroutine.
+        """
+        loop = self.get_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            return loop.run_until_complete(main)
+        finally:
+            asyncio.set_event_loop(None)
+
+    def close(self) -> None:
+        """Annule les tâches restantes puis ferme la boucle."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+def compare_loop_factories(main: Callable[[], Awaitable[Any]],
+                           names: Optional[Iterable[str]] = None,
+                           repeat: int = 5) -> Dict[str, float]:
+    """
+    Mesure la même coroutine sur plusieurs boucles.
+
+    Args:
+        main (Callable): Fonction sans argument retournant la coroutine.
+        names (Optional[Iterable[str]]): Boucles à comparer, par
+        défaut toutes les boucles réelles disponibles.
+        repeat (int): Nombre d'exécutions par boucle.
+
+    Returns:
+        Dict[str, float]: Meilleur temps en secondes par boucle.
+    """
+    if names is None:
+        names = [name for name in available_loop_factories()
+                 if name != 'virtual']
+    timings = {}
+    for name in names:
+        best = float('inf')
+        with LoopRunner(name) as runner:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                runner.run(main())
+                best = min(best, time.perf_counter() - start)
+        timings[name] = best
+    return timings
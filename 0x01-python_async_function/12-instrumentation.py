@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Module contenant une instrumentation optionnelle de wait_random,
+task_wait_random, wait_n et task_wait_n.
+
+Lorsqu'un Recorder est actif (voir instrument), ces fonctions
+enregistrent le délai demandé, le délai réellement obtenu, le
+retard de réveil, la durée de vie des tâches et la durée des
+lots. Les mesures sont agrégées dans des histogrammes de taille
+fixe, fusionnables et exportables en JSON. Sans Recorder actif,
+le coût se limite à la lecture d'une variable de contexte.
+
+Les durées sont lues sur loop.time() : elles sont donc exactes
+sous une boucle à horloge virtuelle (6-virtual_clock.py).
+
+Utilisation :
+    instrument = __import__('12-instrumentation').instrument
+
+    async def main():
+        with instrument() as recorder:
+            await wait_n(10000, 1)
+        print(recorder.to_json())
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import json
+import math
+from array import array
+from typing import Any, Dict, Iterator, Optional
+
+# Recorder actif, hérité par les tâches créées dans son contexte
+_current_recorder: contextvars.ContextVar = contextvars.ContextVar(
+    'recorder', default=None)
+
+
+class LatencyHistogram:
+    """
+    Histogramme logarithmique de durées, de taille fixe.
+
+    Chaque seau couvre une plage relative de largeur precision ;
+    les durées au-delà de max_value tombent dans le dernier seau.
+    """
+
+    def __init__(self, precision: float = 0.02, min_value: float = 1e-6,
+                 max_value: float = 3600.0) -> None:
+        """
+        Args:
+            precision (float): Erreur relative maximale d'un seau.
+            min_value (float): Plus petite durée distinguée, en secondes.
+            max_value (float): Plus grande durée distinguée, en secondes.
+        """
+        self.precision = precision
+        self.min_value = min_value
+        self.max_value = max_value
+        self._log_base = math.log1p(precision)
+        size = 2 + int(math.log(max_value / min_value) / self._log_base)
+        self._counts = array('Q', bytes(8 * size))
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        """Retourne le seau d'une durée, 0 pour les durées < min_value."""
+        if value < self.min_value:
+            return 0
+        index = 1 + int(math.log(value / self.min_value) / self._log_base)
+        return min(index, len(self._counts) - 1)
+
+    def _upper_bound(self, index: int) -> float:
+        """Retourne la borne supérieure d'un seau, en secondes."""
+        if index == 0:
+            return self.min_value
+        return self.min_value * math.exp(index * self._log_base)
+
+    def record(self, value: float) -> None:
+        """
+        Ajoute une durée à l'histogramme.
+
+        Args:
+            value (float): Durée en secondes, éventuellement négative
+            (un réveil en avance compte dans le premier seau).
+        """
+        self._counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """
+        Ajoute les mesures d'un autre histogramme de même paramétrage.
+
+        Args:
+            other (LatencyHistogram): L'histogramme à fusionner.
+
+        Raises:
+            ValueError: Si les paramètres des histogrammes diffèrent.
+        """
+        if len(other._counts) != len(self._counts) or \
+                other.min_value != self.min_value:
+            raise ValueError("histogrammes incompatibles")
+        for index, count in enumerate(other._counts):
+            if count:
+                self._counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct: float) -> float:
+        """
+        Estime un percentile, à precision près.
+
+        Args:
+            pct (float): Percentile voulu, entre 0 et 100.
+
+        Returns:
+            float: La valeur estimée, en secondes (0 si vide).
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Exporte un résumé et les seaux non vides.
+
+        Returns:
+            Dict[str, Any]: Résumé sérialisable en JSON.
+        """
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.total / self.count,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'p999': self.percentile(99.9),
+            'buckets': [[self._upper_bound(index), count]
+                        for index, count in enumerate(self._counts)
+                        if count],
+        }
+
+
+class Recorder:
+    """
+    Ensemble d'histogrammes nommés, créés à la première mesure.
+    """
+
+    def __init__(self, **histogram_options: float) -> None:
+        """
+        Args:
+            **histogram_options: Paramètres de LatencyHistogram.
+        """
+        self._options = histogram_options
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, name: str, value: float) -> None:
+        """
+        Enregistre une durée dans l'histogramme name.
+
+        Args:
+            name (str): Nom de la mesure.
+            value (float): Durée, en secondes.
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram(
+                **self._options)
+        histogram.record(value)
+
+    def record_wait(self, prefix: str, requested: float,
+                    actual: float) -> None:
+        """
+        Enregistre un sommeil : demandé, obtenu et retard.
+
+        Args:
+            prefix (str): Préfixe des mesures, par exemple 'wait_random'.
+            requested (float): Délai demandé, en secondes.
+            actual (float): Délai réellement écoulé, en secondes.
+        """
+        self.record(prefix + '.requested', requested)
+        self.record(prefix + '.actual', actual)
+        self.record(prefix + '.lag', actual - requested)
+
+    def merge(self, other: 'Recorder') -> None:
+        """
+        Fusionne les histogrammes d'un autre Recorder.
+
+        Args:
+            other (Recorder): Le Recorder à fusionner.
+        """
+        for name, histogram in other.histograms.items():
+            if name in self.histograms:
+                self.histograms[name].merge(histogram)
+            else:
+                self.histograms[name] = LatencyHistogram(**self._options)
+                self.histograms[name].merge(histogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Exporte tous les histogrammes.
+
+        Returns:
+            Dict[str, Any]: Histogrammes indexés par nom.
+        """
+        return {name: histogram.to_dict()
+                for name, histogram in sorted(self.histograms.items())}
+
+    def to_json(self, **kwargs: Any) -> str:
+        """
+        Exporte tous les histogrammes en JSON.
+
+        Returns:
+            str: Le document JSON, clés triées.
+        """
+        return json.dumps(self.to_dict(), sort_keys=True, **kwargs)
+
+
+def current_recorder() -> Optional[Recorder]:
+    """
+    Retourne le Recorder actif dans le contexte courant.
+
+    Returns:
+        Optional[Recorder]: Le Recorder, ou None si aucun.
+    """
+    return _current_recorder.get()
+
+
+@contextlib.contextmanager
+def instrument(recorder: Optional[Recorder] = None) -> Iterator[Recorder]:
+    """
+    Active un Recorder pour le bloc et les tâches qui y sont créées.
+
+    Args:
+        recorder (Optional[Recorder]): Recorder à activer, un
+        nouveau par défaut.
+
+    Yields:
+        Recorder: Le Recorder actif.
+    """
+    recorder = recorder or Recorder()
+    token = _current_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_recorder.reset(token)
+
+
+@contextlib.contextmanager
+def timed(name: str) -> Iterator[None]:
+    """
+    Mesure la durée du bloc sur l'horloge de la boucle,
+    si un Recorder est actif.
+
+    Args:
+        name (str): Nom de la mesure.
+    """
+    recorder = _current_recorder.get()
+    if recorder is None:
+        yield
+        return
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    try:
+        yield
+    finally:
+        recorder.record(name, loop.time() - start)
+
+
+async def monitor_loop_lag(interval: float = 0.01,
+                           recorder: Optional[Recorder] = None) -> None:
+    """
+    Mesure en continu le retard de la boucle : l'écart entre
+    l'heure de réveil prévue d'un sommeil et l'heure réelle.
+    À lancer dans une tâche, puis à annuler.
+
+    Args:
+        interval (float): Période de mesure, en secondes.
+        recorder (Optional[Recorder]): Recorder cible, par
+        défaut le Recorder actif.
+
+    Raises:
+        RuntimeError: Si aucun Recorder n'est disponible.
+    """
+    recorder = recorder or current_recorder()
+    if recorder is None:
+        raise RuntimeError("aucun Recorder actif")
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        recorder.record('loop.lag', loop.time() - start - interval)
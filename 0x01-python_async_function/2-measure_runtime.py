@@ -6,11 +6,13 @@ la coroutine wait_n avec différents paramètres.
 
 import time
 import asyncio
+from typing import Any, Optional
 # Importe la coroutine wait_n du fichier 1-concurrent_coroutines.py
 wait_n = __import__('1-concurrent_coroutines').wait_n
 
 
-def measure_time(n: int, max_delay: int) -> float:
+def measure_time(n: int, max_delay: int,
+                 runner: Optional[Any] = None) -> float:
     """
     Mesure le temps total d'exécution de wait_n(n, max_delay)
     et retourne le temps moyen par coroutine.
@@ -20,15 +22,24 @@ def measure_time(n: int, max_delay: int) -> float:
         simultanément avec wait_n.
         max_delay (int): Délai maximum
         à passer à chaque appel de wait_n.
+        runner (LoopRunner): Exécuteur à boucle persistante
+        (11-loop_runner.py) ; par défaut asyncio.run, qui crée
+        et détruit une boucle à chaque mesure.
 
     Returns:
         float: Temps moyen d'exécution par coroutine, en secondes.
+
+    Pour des mesures répétées avec chauffe et percentiles,
+    utiliser benchmark.py à la racine du dépôt.
     """
-    # Temps de début de l'exécution
-    strt_time = time.time()
+    # Temps de début de l'exécution (horloge monotone haute résolution)
+    strt_time = time.perf_counter()
     # Exécute la coroutine wait_n avec les paramètres donnés
-    asyncio.run(wait_n(n, max_delay))
+    if runner is None:
+        asyncio.run(wait_n(n, max_delay))
+    else:
+        runner.run(wait_n(n, max_delay))
     # Calcul du temps total d'exécution
-    ttl_time = time.time() - strt_time
+    ttl_time = time.perf_counter() - strt_time
     # Retourne le temps moyen par coroutine
     return ttl_time / n
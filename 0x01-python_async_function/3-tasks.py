@@ -5,20 +5,34 @@ une tâche asyncio pour la coroutine wait_random.
 """
 
 import asyncio
+from typing import Any, Awaitable, Callable, Optional
 # Importe la coroutine wait_random du fichier 0-basic_async_syntax.py
 wait_random = __import__('0-basic_async_syntax').wait_random
+# Importe l'instrumentation optionnelle du fichier 12-instrumentation.py
+current_recorder = __import__('12-instrumentation').current_recorder
 
 
-def task_wait_random(max_delay: int) -> asyncio.Task:
+def task_wait_random(max_delay: int,
+                     sleep: Optional[Callable[[float], Awaitable[Any]]]
+                     = None) -> asyncio.Task:
     """
     Crée et retourne une asyncio.Task pour la coroutine
     wait_random avec le délai maximum spécifié.
 
     Args:
         max_delay (int): Délai maximum à passer à wait_random.
+        sleep (Callable): Fonction de sommeil passée à wait_random.
 
     Returns:
         asyncio.Task: Tâche asyncio pour exécuter
         wait_random avec le délai maximum spécifié.
     """
-    return asyncio.create_task(wait_random(max_delay))
+    task = asyncio.create_task(wait_random(max_delay, sleep=sleep))
+    recorder = current_recorder()
+    if recorder is not None:
+        # Durée de vie de la tâche, de sa création à sa fin
+        loop = asyncio.get_running_loop()
+        created = loop.time()
+        task.add_done_callback(lambda _: recorder.record(
+            'task_wait_random.lifetime', loop.time() - created))
+    return task
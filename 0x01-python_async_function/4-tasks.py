@@ -5,12 +5,21 @@ créer plusieurs tâches avec task_wait_random.
 """
 
 import asyncio
-from typing import List
+import functools
+import itertools
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
 # Importe la fonction task_wait_random du fichier 3-tasks.py
 task_wait_random = __import__('3-tasks').task_wait_random
+# Importe l'ordonnanceur borné du fichier 5-bounded_scheduler.py
+bounded_as_completed = __import__('5-bounded_scheduler').bounded_as_completed
+# Importe l'instrumentation optionnelle du fichier 12-instrumentation.py
+timed = __import__('12-instrumentation').timed
 
 
-async def task_wait_n(n: int, max_delay: int) -> List[float]:
+async def task_wait_n(n: int, max_delay: int,
+                      max_in_flight: Optional[int] = None,
+                      sleep: Optional[Callable[[float], Awaitable[Any]]]
+                      = None) -> List[float]:
     """
     Crée n tâches avec task_wait_random et retourne la liste des délais.
 
@@ -18,15 +27,75 @@ async def task_wait_n(n: int, max_delay: int) -> List[float]:
         n (int): Nombre de tâches à créer.
         max_delay (int): Délai maximum à passer à
         chaque appel de task_wait_random.
+        max_in_flight (Optional[int]): Si fourni, nombre maximum
+        de tâches en cours ; les tâches sont alors créées au fur
+        et à mesure au lieu d'être toutes créées d'avance.
+        sleep (Callable): Fonction de sommeil passée à
+        task_wait_random, par exemple wheel_sleep.
 
     Returns:
         List[float]: Liste des délais générés par
         task_wait_random, triés par ordre croissant.
     """
-    # Crée une liste de tâches asyncio avec task_wait_random
-    tasks = [task_wait_random(max_delay) for _ in range(n)]
-    # Exécute toutes les tâches demanière
-    # concurrente et attend leur achèvement
-    delays = await asyncio.gather(*tasks)
+    with timed('task_wait_n.duration'):
+        if max_in_flight is not None:
+            # Même ordonnanceur borné que wait_n
+            factories = itertools.repeat(
+                functools.partial(task_wait_random, max_delay, sleep), n)
+            delays = [delay async for delay in
+                      bounded_as_completed(factories, max_in_flight)]
+        else:
+            # Crée une liste de tâches asyncio avec task_wait_random
+            tasks = [task_wait_random(max_delay, sleep) for _ in range(n)]
+            # Exécute toutes les tâches demanière
+            # concurrente et attend leur achèvement
+            delays = await asyncio.gather(*tasks)
     # Trie les délais générés par task_wait_random par ordre croissant
     return sorted(delays)
+
+
+async def task_wait_n_as_completed(
+        n: int, max_delay: int,
+        max_in_flight: Optional[int] = None) -> AsyncIterator[float]:
+    """
+    Crée n tâches avec task_wait_random et produit chaque
+    délai dès que sa tâche se termine.
+
+    Les délais arrivent dans l'ordre d'achèvement, pas triés : une
+    tâche créée plus tard avec un délai plus court peut finir après
+    une autre, et cet écart grandit avec n. Avec max_in_flight,
+    l'ordre ne suit plus du tout les délais. Trier le résultat si
+    l'ordre croissant est nécessaire (comme task_wait_n).
+    Si l'itération est interrompue, les tâches restantes sont annulées.
+
+    Args:
+        n (int): Nombre de tâches à créer.
+        max_delay (int): Délai maximum à passer à
+        chaque appel de task_wait_random.
+        max_in_flight (Optional[int]): Si fourni, nombre
+        maximum de tâches en cours à la fois.
+
+    Yields:
+        float: Chaque délai, dans l'ordre d'achèvement (non trié).
+    """
+    if max_in_flight is not None:
+        factories = itertools.repeat(
+            functools.partial(task_wait_random, max_delay), n)
+        delays = bounded_as_completed(factories, max_in_flight)
+        try:
+            async for delay in delays:
+                yield delay
+        finally:
+            # Ferme l'ordonnanceur tout de suite, sans attendre le
+            # ramasse-miettes, pour annuler ses travailleurs
+            await delays.aclose()
+        return
+    tasks = [task_wait_random(max_delay) for _ in range(n)]
+    try:
+        for delay in asyncio.as_completed(tasks):
+            yield await delay
+    finally:
+        # Annule les tâches encore en cours si le consommateur s'arrête
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Module contenant un ordonnanceur à concurrence bornée :
+un pool de travailleurs consomme paresseusement un itérable
+de fabriques de coroutines, sans jamais dépasser max_in_flight
+coroutines en cours.
+
+Utilisation :
+    bounded_as_completed = __import__(
+        '5-bounded_scheduler').bounded_as_completed
+
+    fabriques = itertools.repeat(functools.partial(wait_random, 10), 10**6)
+    async for delai in bounded_as_completed(fabriques, 1000):
+        ...
+"""
+
+import asyncio
+from typing import (Any, AsyncIterator, Awaitable, Callable,
+                    Iterable, List)
+
+# Marqueur de fin envoyé par chaque travailleur
+_DONE = object()
+
+
+async def bounded_as_completed(
+        factories: Iterable[Callable[[], Awaitable[Any]]],
+        max_in_flight: int) -> AsyncIterator[Any]:
+    """
+    Exécute les fabriques de coroutines avec au plus max_in_flight
+    coroutines simultanées et produit chaque résultat dès qu'il
+    est disponible.
+
+    Les fabriques sont tirées une à une de l'itérable, ce qui permet
+    de passer un générateur : la mémoire occupée dépend de
+    max_in_flight et non du nombre total de coroutines.
+
+    Args:
+        factories (Iterable): Fonctions sans argument qui retournent
+        chacune un objet attendable.
+        max_in_flight (int): Nombre maximum de coroutines en cours.
+
+    Yields:
+        Any: Le résultat de chaque coroutine, dans l'ordre d'achèvement.
+
+    Raises:
+        ValueError: Si max_in_flight est inférieur à 1.
+        BaseException: La première exception levée par une
+        coroutine, y compris CancelledError si une tâche fournie
+        est annulée, après annulation des travailleurs restants.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight doit être supérieur ou égal à 1")
+    iterator = iter(factories)
+    # File bornée : un consommateur lent freine les travailleurs
+    results: asyncio.Queue = asyncio.Queue(maxsize=max_in_flight)
+    failures: List[BaseException] = []
+    closing = False
+
+    async def worker() -> None:
+        """Tire la prochaine fabrique tant que l'itérable n'est pas vide."""
+        try:
+            for factory in iterator:
+                await results.put(await factory())
+        except BaseException as exc:
+            # Y compris CancelledError, quand un attendable fourni
+            # (une tâche par exemple) est annulé par un tiers
+            failures.append(exc)
+        finally:
+            # Toujours prévenir le consommateur, sinon il attend
+            # indéfiniment sur results.get() ; inutile s'il est parti
+            if not closing:
+                await results.put(_DONE)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max_in_flight)]
+    try:
+        running = len(workers)
+        while running:
+            result = await results.get()
+            if result is _DONE:
+                if failures:
+                    raise failures[0]
+                running -= 1
+                continue
+            yield result
+    finally:
+        closing = True
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
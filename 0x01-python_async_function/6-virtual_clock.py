@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Module contenant une boucle d'événements à horloge virtuelle.
+
+Au lieu de bloquer jusqu'au prochain minuteur, la boucle avance
+son horloge directement à l'échéance de ce minuteur. Les coroutines
+existantes (wait_random, wait_n, async_generator...) s'exécutent
+sans modification, en temps CPU plutôt qu'en temps réel, et
+loop.time() mesure exactement le temps simulé.
+
+Les entrées/sorties réelles restent surveillées : la boucle ne
+saute dans le temps que lorsqu'aucun événement n'est prêt. Les
+travaux exécutés dans des threads ne sont pas attendus par
+l'horloge virtuelle.
+
+Utilisation :
+    run_virtual = __import__('6-virtual_clock').run_virtual
+    wait_n = __import__('1-concurrent_coroutines').wait_n
+
+    print(run_virtual(wait_n(1000000, 10)))  # Aucune attente réelle
+
+    # Ou pour tout le processus :
+    asyncio.set_event_loop_policy(VirtualClockEventLoopPolicy())
+"""
+
+import asyncio
+import selectors
+from typing import Any, Awaitable, List, Optional, Tuple
+
+
+class _VirtualSelector:
+    """
+    Enveloppe un sélecteur réel : une attente avec délai devient
+    une simple scrutation suivie d'une avance de l'horloge virtuelle.
+    """
+
+    def __init__(self, selector: selectors.BaseSelector,
+                 loop: 'VirtualClockEventLoop') -> None:
+        """
+        Args:
+            selector (selectors.BaseSelector): Sélecteur réel enveloppé.
+            loop (VirtualClockEventLoop): Boucle dont l'horloge avance.
+        """
+        self._selector = selector
+        self._loop = loop
+
+    def select(self, timeout: Optional[float] = None) -> List[Tuple]:
+        """
+        Scrute les entrées/sorties sans bloquer, puis avance
+        l'horloge virtuelle de timeout si rien n'est prêt.
+
+        Args:
+            timeout (Optional[float]): Délai demandé par la boucle ;
+            None signifie qu'aucun minuteur n'est programmé.
+
+        Returns:
+            List[Tuple]: Les événements prêts, comme selectors.
+        """
+        if timeout is None:
+            # Aucun minuteur : seule une entrée/sortie peut réveiller
+            return self._selector.select(None)
+        events = self._selector.select(0)
+        if not events and timeout > 0:
+            self._loop.advance(timeout)
+        return events
+
+    def __getattr__(self, name: str) -> Any:
+        """Délègue register, unregister, get_key... au sélecteur réel."""
+        return getattr(self._selector, name)
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """
+    Boucle d'événements dont l'horloge saute directement
+    au prochain minuteur au lieu de l'attendre.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        """
+        Args:
+            start (float): Valeur initiale de l'horloge virtuelle.
+        """
+        self._virtual_time = start
+        super().__init__(_VirtualSelector(selectors.DefaultSelector(), self))
+
+    def time(self) -> float:
+        """
+        Retourne le temps virtuel courant, en secondes.
+
+        Returns:
+            float: Le temps virtuel.
+        """
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        """
+        Avance l'horloge virtuelle.
+
+        Args:
+            seconds (float): Durée à ajouter, positive ou nulle.
+
+        Raises:
+            ValueError: Si seconds est négatif.
+        """
+        if seconds < 0:
+            raise ValueError("l'horloge virtuelle ne peut pas reculer")
+        self._virtual_time += seconds
+
+
+class VirtualClockEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """
+    Politique qui crée des boucles à horloge virtuelle,
+    utilisable avec asyncio.set_event_loop_policy.
+    """
+
+    def new_event_loop(self) -> VirtualClockEventLoop:
+        """
+        Crée une nouvelle boucle à horloge virtuelle.
+
+        Returns:
+            VirtualClockEventLoop: La nouvelle boucle.
+        """
+        return VirtualClockEventLoop()
+
+
+def run_virtual(main: Awaitable[Any], start: float = 0.0) -> Any:
+    """
+    Équivalent de asyncio.run sur une boucle à horloge virtuelle.
+
+    Args:
+        main (Awaitable): Coroutine à exécuter.
+        start (float): Valeur initiale de l'horloge virtuelle.
+
+    Returns:
+        Any: Le résultat de la coroutine.
+    """
+    loop = VirtualClockEventLoop(start)
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            # Annule les tâches restantes comme le fait asyncio.run
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
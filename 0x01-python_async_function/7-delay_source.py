@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Module contenant des sources de délais pour wait_random.
+
+Une DelaySource pré-génère les délais par blocs dans un tampon
+array('d'), avec NumPy lorsqu'il est installé, et les distribue
+un par un. Chaque source a son propre générateur, initialisable
+par une graine, et peut être associée à une boucle d'événements :
+wait_random l'utilise alors à la place de random.uniform.
+
+Les distributions paramétriques sont exprimées en fraction de
+max_delay ; la distribution empirique rejoue des délais en
+secondes. Les lois sont tronquées à max_delay : une valeur plus
+grande est retirée (ou sautée pour la distribution empirique) au
+lieu d'être ramenée à max_delay, ce qui empilerait toute la queue
+de la loi sur cette seule valeur. La moyenne obtenue est donc
+celle de la loi tronquée.
+
+Utilisation :
+    DelaySource = __import__('7-delay_source').DelaySource
+    set_delay_source = __import__('7-delay_source').set_delay_source
+
+    async def main():
+        set_delay_source(DelaySource('lognormal', seed=42, sigma=1.0))
+        return await wait_n(10000, 10)
+"""
+
+import asyncio
+import random
+import weakref
+from array import array
+from typing import Any, Optional, Sequence
+
+DISTRIBUTIONS = ('uniform', 'exponential', 'lognormal', 'empirical')
+
+# Source associée à chaque boucle d'événements
+_loop_sources: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _import_numpy() -> Any:
+    """
+    Importe NumPy à la demande, pour ne pas le charger chez tous
+    les utilisateurs de wait_random.
+
+    Returns:
+        Any: Le module numpy, ou None s'il n'est pas installé.
+    """
+    try:
+        import numpy
+    except ImportError:  # NumPy est optionnel
+        return None
+    return numpy
+
+
+class DelaySource:
+    """
+    Source de délais pré-générés par blocs.
+    """
+
+    def __init__(self, distribution: str = 'uniform',
+                 seed: Optional[int] = None, batch_size: int = 4096,
+                 use_numpy: Optional[bool] = None,
+                 mean: float = 0.5, mu: float = -1.5, sigma: float = 0.5,
+                 samples: Optional[Sequence[float]] = None) -> None:
+        """
+        Args:
+            distribution (str): 'uniform', 'exponential',
+            'lognormal' ou 'empirical'.
+            seed (Optional[int]): Graine du générateur.
+            batch_size (int): Nombre de délais générés par bloc.
+            use_numpy (Optional[bool]): Force ou interdit NumPy ;
+            par défaut NumPy est utilisé s'il est installé.
+            mean (float): Moyenne de la loi exponentielle avant
+            troncature, strictement positive.
+            mu (float): Paramètre mu de la loi log-normale.
+            sigma (float): Paramètre sigma de la loi log-normale,
+            positif ou nul.
+            samples (Optional[Sequence[float]]): Délais rejoués, en
+            secondes et positifs ou nuls, pour la distribution
+            empirique.
+
+        Raises:
+            ValueError: Si la distribution ou ses paramètres
+            sont invalides.
+        """
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError("distribution inconnue : {}".format(
+                distribution))
+        if batch_size < 1:
+            raise ValueError("batch_size doit être supérieur ou égal à 1")
+        if distribution == 'empirical' and not samples:
+            raise ValueError("la distribution empirique exige samples")
+        if not mean > 0:
+            raise ValueError("mean doit être strictement positif")
+        if not sigma >= 0:
+            raise ValueError("sigma doit être positif ou nul")
+        if samples and not min(samples) >= 0:
+            raise ValueError("samples doit contenir des délais positifs")
+        numpy = None if use_numpy is False else _import_numpy()
+        if use_numpy and numpy is None:
+            raise ValueError("NumPy n'est pas installé")
+        self.distribution = distribution
+        self.seed = seed
+        self.batch_size = batch_size
+        self.use_numpy = numpy is not None
+        self.mean = mean
+        self.mu = mu
+        self.sigma = sigma
+        self._samples = array('d', samples or ())
+        self._min_sample = min(self._samples, default=0.0)
+        self._replay_pos = 0
+        if self.use_numpy:
+            self._rng: Any = numpy.random.default_rng(seed)
+        else:
+            self._rng = random.Random(seed)
+        self._buffer = array('d')
+        self._index = 0
+
+    def _generate(self, count: int) -> array:
+        """
+        Génère un bloc de délais selon la distribution ; les valeurs
+        paramétriques supérieures à 1 (max_delay) sont retirées.
+
+        Args:
+            count (int): Nombre de délais à générer.
+
+        Returns:
+            array: Les délais générés.
+        """
+        if self.distribution == 'empirical':
+            # Rejoue les échantillons dans l'ordre, en boucle
+            out = array('d')
+            size = len(self._samples)
+            while len(out) < count:
+                end = min(size, self._replay_pos + count - len(out))
+                out.extend(self._samples[self._replay_pos:end])
+                self._replay_pos = end % size
+            return out
+        out = array('d')
+        while len(out) < count:
+            # Loi tronquée : on retire au lieu de plafonner
+            out.extend(value for value in self._draw_raw(count - len(out))
+                       if value <= 1.0)
+        return out
+
+    def _draw_raw(self, count: int) -> array:
+        """
+        Tire count valeurs de la loi paramétrique, sans troncature.
+
+        Args:
+            count (int): Nombre de valeurs.
+
+        Returns:
+            array: Les valeurs, en fraction de max_delay.
+        """
+        rng = self._rng
+        if self.use_numpy:
+            if self.distribution == 'uniform':
+                batch = rng.random(count)
+            elif self.distribution == 'exponential':
+                batch = rng.exponential(self.mean, count)
+            else:
+                batch = rng.lognormal(self.mu, self.sigma, count)
+            out = array('d')
+            out.frombytes(batch.astype('float64').tobytes())
+            return out
+        if self.distribution == 'uniform':
+            return array('d', [rng.random() for _ in range(count)])
+        if self.distribution == 'exponential':
+            rate = 1 / self.mean
+            return array('d', [rng.expovariate(rate) for _ in range(count)])
+        return array('d', [rng.lognormvariate(self.mu, self.sigma)
+                           for _ in range(count)])
+
+    def _next(self) -> float:
+        """Retourne la prochaine valeur du tampon, en le remplissant."""
+        if self._index >= len(self._buffer):
+            self._buffer = self._generate(self.batch_size)
+            self._index = 0
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+
+    def draw(self, max_delay: float) -> float:
+        """
+        Retourne le prochain délai de la loi tronquée à max_delay.
+
+        Args:
+            max_delay (float): Délai maximum, en secondes.
+
+        Returns:
+            float: Le délai, entre 0 et max_delay.
+
+        Raises:
+            ValueError: Si aucun échantillon empirique ne tient
+            sous max_delay.
+        """
+        if self.distribution != 'empirical':
+            return self._next() * max_delay
+        if max_delay < self._min_sample:
+            raise ValueError("aucun échantillon inférieur à max_delay")
+        value = self._next()
+        while value > max_delay:
+            # Échantillon trop long pour ce max_delay : on le saute
+            value = self._next()
+        return value
+
+    def spawn(self) -> 'DelaySource':
+        """
+        Crée une source indépendante de même distribution, dont la
+        graine dérive de celle-ci (un flux par boucle, par exemple).
+
+        Returns:
+            DelaySource: La nouvelle source.
+        """
+        if self.use_numpy:
+            seed = int(self._rng.integers(0, 2 ** 63))
+        else:
+            seed = self._rng.getrandbits(63)
+        return DelaySource(self.distribution, seed, self.batch_size,
+                           self.use_numpy, self.mean, self.mu, self.sigma,
+                           self._samples)
+
+
+def set_delay_source(source: Optional[DelaySource],
+                     loop: Optional[asyncio.AbstractEventLoop] = None
+                     ) -> None:
+    """
+    Associe une source de délais à une boucle d'événements.
+
+    Args:
+        source (Optional[DelaySource]): La source, ou None pour
+        revenir à random.uniform.
+        loop (Optional[asyncio.AbstractEventLoop]): La boucle,
+        par défaut la boucle en cours d'exécution.
+    """
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    if source is None:
+        _loop_sources.pop(loop, None)
+    else:
+        _loop_sources[loop] = source
+
+
+def current_delay_source() -> Optional[DelaySource]:
+    """
+    Retourne la source associée à la boucle en cours d'exécution.
+
+    Returns:
+        Optional[DelaySource]: La source, ou None si aucune.
+    """
+    try:
+        return _loop_sources.get(asyncio.get_running_loop())
+    except RuntimeError:
+        return None
+
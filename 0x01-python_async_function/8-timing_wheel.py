@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Module contenant une roue temporelle hiérarchique pour endormir
+un très grand nombre de coroutines.
+
+Chaque asyncio.sleep ajoute un TimerHandle au tas de la boucle
+(coût O(log n) et un rappel par minuteur). La roue range les
+réveils dans des seaux partagés d'une granularité tick : un seul
+minuteur de boucle fait avancer la roue, l'insertion d'un
+sommeil est en O(1) et chaque réveil est, amorti, en O(1).
+
+Un sommeil n'est jamais réveillé en avance, mais peut l'être
+jusqu'à un tick en retard.
+
+Utilisation :
+    wheel_sleep = __import__('8-timing_wheel').wheel_sleep
+
+    await wheel_sleep(2.5)
+    await wait_n(100000, 10, sleep=wheel_sleep)
+"""
+
+import asyncio
+import math
+import weakref
+from typing import List, Optional, Tuple
+
+# Roue associée à chaque boucle d'événements
+_loop_wheels: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+class TimingWheel:
+    """
+    Roue temporelle hiérarchique attachée à une boucle d'événements.
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None,
+                 tick: float = 0.001, slots: int = 256,
+                 levels: int = 4) -> None:
+        """
+        Args:
+            loop (Optional[asyncio.AbstractEventLoop]): La boucle,
+            par défaut la boucle en cours d'exécution.
+            tick (float): Résolution de la roue, en secondes.
+            slots (int): Nombre de seaux par niveau.
+            levels (int): Nombre de niveaux ; la roue couvre
+            tick * slots ** levels secondes avant le débordement.
+
+        Raises:
+            ValueError: Si un paramètre n'est pas strictement positif.
+        """
+        if tick <= 0 or slots < 2 or levels < 1:
+            raise ValueError("tick, slots et levels doivent être positifs")
+        # Référence faible : la roue ne doit pas garder la boucle en vie
+        self._loop = weakref.proxy(loop or asyncio.get_running_loop())
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        # Durée, en ticks, couverte par un seau de chaque niveau
+        self._spans = [slots ** level for level in range(levels + 1)]
+        self._wheels: List[List[List[Tuple[int, asyncio.Future]]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)]
+        self._overflow: List[Tuple[int, asyncio.Future]] = []
+        self._origin = self._loop.time()
+        self._current = 0
+        self._size = 0
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        """Nombre de sommeils encore rangés dans la roue."""
+        return self._size
+
+    def sleep(self, delay: float) -> asyncio.Future:
+        """
+        Retourne un futur résolu après au moins delay secondes.
+
+        Args:
+            delay (float): Durée du sommeil, en secondes.
+
+        Returns:
+            asyncio.Future: Futur à attendre.
+        """
+        future = self._loop.create_future()
+        if delay <= 0:
+            future.set_result(None)
+            return future
+        elapsed = (self._loop.time() - self._origin) / self.tick
+        if not self._size:
+            # Roue vide : on la recale sur l'heure courante
+            self._current = math.floor(elapsed)
+        expiry = math.ceil(elapsed + delay / self.tick)
+        # Le seau du tick courant est déjà traité : au plus tôt le suivant
+        self._insert(max(expiry, self._current + 1), future)
+        self._size += 1
+        if self._handle is None:
+            self._schedule()
+        return future
+
+    def _insert(self, expiry: int, future: asyncio.Future) -> None:
+        """
+        Range un futur dans le seau correspondant à son échéance.
+
+        Une échéance égale au tick courant n'est valable que pendant
+        une redescente, avant le traitement du seau de ce tick.
+
+        Args:
+            expiry (int): Échéance, en ticks depuis l'origine,
+            supérieure ou égale au tick courant.
+            future (asyncio.Future): Futur à résoudre à l'échéance.
+        """
+        diff = expiry - self._current
+        for level in range(self.levels):
+            if diff < self._spans[level + 1]:
+                index = (expiry // self._spans[level]) % self.slots
+                self._wheels[level][index].append((expiry, future))
+                return
+        self._overflow.append((expiry, future))
+
+    def _advance(self) -> None:
+        """Avance la roue d'un tick et réveille les sommeils échus."""
+        self._current += 1
+        current = self._current
+        # Redescend d'abord les seaux des niveaux supérieurs
+        for level in range(1, self.levels):
+            if current % self._spans[level]:
+                break
+            index = (current // self._spans[level]) % self.slots
+            bucket = self._wheels[level][index]
+            self._wheels[level][index] = []
+            for expiry, future in bucket:
+                self._insert(expiry, future)
+        if self._overflow and not current % self._spans[self.levels]:
+            overflow, self._overflow = self._overflow, []
+            for expiry, future in overflow:
+                self._insert(expiry, future)
+        index = current % self.slots
+        bucket = self._wheels[0][index]
+        self._wheels[0][index] = []
+        self._size -= len(bucket)
+        for _, future in bucket:
+            # Les sommeils annulés restent dans la roue jusqu'ici
+            if not future.done():
+                future.set_result(None)
+
+    def _schedule(self) -> None:
+        """Programme le prochain tick sur la boucle."""
+        self._handle = self._loop.call_at(
+            self._origin + (self._current + 1) * self.tick, self._run)
+
+    def _run(self) -> None:
+        """Rattrape tous les ticks écoulés puis reprogramme la roue."""
+        self._handle = None
+        elapsed = (self._loop.time() - self._origin) / self.tick
+        target = max(self._current + 1, math.floor(elapsed))
+        while self._size and self._current < target:
+            self._advance()
+        if self._size:
+            self._schedule()
+
+
+def get_timing_wheel(loop: Optional[asyncio.AbstractEventLoop] = None,
+                     **kwargs: float) -> TimingWheel:
+    """
+    Retourne la roue associée à une boucle, en la créant au besoin.
+
+    Args:
+        loop (Optional[asyncio.AbstractEventLoop]): La boucle,
+        par défaut la boucle en cours d'exécution.
+        **kwargs: tick, slots et levels, utilisés à la création.
+
+    Returns:
+        TimingWheel: La roue de la boucle.
+    """
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    wheel = _loop_wheels.get(loop)
+    if wheel is None:
+        wheel = _loop_wheels[loop] = TimingWheel(loop, **kwargs)
+    return wheel
+
+
+def wheel_sleep(delay: float) -> asyncio.Future:
+    """
+    Équivalent de asyncio.sleep passant par la roue de la boucle.
+
+    Args:
+        delay (float): Durée du sommeil, en secondes.
+
+    Returns:
+        asyncio.Future: Futur à attendre.
+    """
+    return get_timing_wheel().sleep(delay)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Module contenant une version multi-processus de wait_n.
+
+Les n appels sont répartis en shards sur un pool de processus ;
+chaque processus exécute wait_n sur sa propre boucle d'événements
+et renvoie une liste déjà triée. Les listes sont ensuite
+fusionnées par une fusion k-voies (heapq.merge), sans nouveau tri.
+
+Utilisation :
+    sharded_wait_n = __import__('9-sharded_wait_n').sharded_wait_n
+
+    print(asyncio.run(sharded_wait_n(1000000, 10)))
+"""
+
+import asyncio
+import heapq
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional
+# Importe la coroutine wait_n du fichier 1-concurrent_coroutines.py
+wait_n = __import__('1-concurrent_coroutines').wait_n
+
+
+def split_shards(n: int, shards: int) -> List[int]:
+    """
+    Répartit n appels aussi équitablement que possible.
+
+    Args:
+        n (int): Nombre total d'appels.
+        shards (int): Nombre de shards.
+
+    Returns:
+        List[int]: Taille de chaque shard non vide.
+
+    Raises:
+        ValueError: Si shards est inférieur à 1.
+    """
+    if shards < 1:
+        raise ValueError("shards doit être supérieur ou égal à 1")
+    size, extra = divmod(n, shards)
+    sizes = [size + 1 if index < extra else size for index in range(shards)]
+    return [size for size in sizes if size]
+
+
+def _run_shard(n: int, max_delay: int,
+               max_in_flight: Optional[int]) -> List[float]:
+    """
+    Exécute wait_n dans le processus courant, sur une nouvelle boucle.
+
+    Args:
+        n (int): Nombre d'appels du shard.
+        max_delay (int): Délai maximum passé à wait_random.
+        max_in_flight (Optional[int]): Limite de concurrence du shard.
+
+    Returns:
+        List[float]: Délais du shard, triés par ordre croissant.
+    """
+    return asyncio.run(wait_n(n, max_delay, max_in_flight))
+
+
+async def sharded_wait_n(n: int, max_delay: int,
+                         shards: Optional[int] = None,
+                         max_in_flight: Optional[int] = None,
+                         executor: Optional[Executor] = None) -> List[float]:
+    """
+    Répartit wait_n(n, max_delay) sur plusieurs processus
+    et retourne la liste fusionnée des délais.
+
+    Args:
+        n (int): Nombre total d'appels à wait_random.
+        max_delay (int): Délai maximum passé à wait_random.
+        shards (Optional[int]): Nombre de shards, par défaut
+        le nombre de processeurs.
+        max_in_flight (Optional[int]): Limite de concurrence
+        appliquée dans chaque shard.
+        executor (Optional[Executor]): Pool à utiliser ; par défaut
+        un ProcessPoolExecutor créé et fermé pour l'appel.
+
+    Returns:
+        List[float]: Liste des délais, triés par ordre croissant.
+
+    Raises:
+        ValueError: Si shards est inférieur à 1.
+    """
+    if shards is None:
+        shards = os.cpu_count() or 1
+    sizes = split_shards(n, shards)
+    if not sizes:
+        return []
+    loop = asyncio.get_running_loop()
+    pool = executor or ProcessPoolExecutor(max_workers=len(sizes))
+    try:
+        runs = await asyncio.gather(*(
+            loop.run_in_executor(pool, _run_shard, size, max_delay,
+                                 max_in_flight)
+            for size in sizes))
+    except BaseException:
+        if executor is None:
+            # Annulation ou erreur : ne bloque pas la boucle en
+            # attendant les shards déjà lancés
+            pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    if executor is None:
+        # Les shards sont finis ; l'arrêt des processus se fait
+        # hors de la boucle
+        await loop.run_in_executor(None, pool.shutdown)
+    # Chaque shard est déjà trié : une fusion k-voies suffit
+    return list(heapq.merge(*runs))
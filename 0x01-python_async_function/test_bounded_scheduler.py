@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests pour l'ordonnanceur à concurrence bornée.
+Auteur SAID LAMGHARI
+"""
+import asyncio
+import unittest
+
+bounded_as_completed = __import__(
+    '5-bounded_scheduler').bounded_as_completed
+wait_n_as_completed = __import__(
+    '1-concurrent_coroutines').wait_n_as_completed
+task_wait_n_as_completed = __import__(
+    '4-tasks').task_wait_n_as_completed
+
+
+async def collect(factories, max_in_flight):
+    """Retourne tous les résultats de bounded_as_completed."""
+    return [result async for result in
+            bounded_as_completed(factories, max_in_flight)]
+
+
+class TestBoundedAsCompleted(unittest.IsolatedAsyncioTestCase):
+    """
+    Classe de tests pour bounded_as_completed.
+    """
+
+    async def test_results_and_bound(self):
+        """
+        Teste que tous les résultats sont produits sans jamais
+        dépasser max_in_flight coroutines en cours.
+        """
+        in_flight = 0
+        peak = 0
+
+        async def job(value):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * (value % 3))
+            in_flight -= 1
+            return value
+
+        factories = (lambda i=i: job(i) for i in range(50))
+        results = await collect(factories, 4)
+        self.assertEqual(sorted(results), list(range(50)))
+        self.assertLessEqual(peak, 4)
+
+    async def test_invalid_max_in_flight(self):
+        """
+        Teste que max_in_flight < 1 lève ValueError.
+        """
+        with self.assertRaises(ValueError):
+            await collect([], 0)
+
+    async def test_exception_propagates(self):
+        """
+        Teste que l'exception d'une coroutine est relancée
+        et que les autres travailleurs sont annulés.
+        """
+        async def fail():
+            raise RuntimeError("échec")
+
+        factories = [lambda: asyncio.sleep(10), fail]
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(collect(factories, 2), 1)
+        await asyncio.sleep(0)
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        self.assertEqual(pending, set())
+
+    async def test_cancelled_awaitable(self):
+        """
+        Teste qu'une tâche fournie, annulée par un tiers, relance
+        CancelledError chez le consommateur au lieu de le bloquer.
+        """
+        victim = asyncio.ensure_future(asyncio.sleep(10))
+        asyncio.get_running_loop().call_later(0.01, victim.cancel)
+        factories = [lambda: victim, lambda: asyncio.sleep(0.05)]
+
+        try:
+            await asyncio.wait_for(collect(factories, 2), 1)
+            outcome = 'terminé'
+        except asyncio.TimeoutError:
+            outcome = 'bloqué'
+        except asyncio.CancelledError:
+            outcome = 'annulé'
+        self.assertEqual(outcome, 'annulé')
+
+    async def test_early_stop_cancels_workers(self):
+        """
+        Teste que l'arrêt du consommateur annule les travailleurs.
+        """
+        factories = (lambda: asyncio.sleep(0.01, 'ok') for _ in range(100))
+        agen = bounded_as_completed(factories, 3)
+        self.assertEqual(await agen.__anext__(), 'ok')
+        await agen.aclose()
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        self.assertEqual(pending, set())
+
+
+
+class TestAsCompletedEarlyStop(unittest.IsolatedAsyncioTestCase):
+    """
+    Classe de tests pour l'arrêt anticipé de wait_n_as_completed
+    et task_wait_n_as_completed.
+    """
+
+    async def check_early_stop(self, agen):
+        """
+        Consomme une valeur, ferme le générateur et vérifie qu'aucune
+        tâche ne reste en cours, sans laisser tourner la boucle.
+        """
+        self.assertIsInstance(await agen.__anext__(), float)
+        await agen.aclose()
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        self.assertEqual(pending, set())
+
+    async def test_wait_n_as_completed(self):
+        """
+        Teste l'arrêt anticipé de wait_n_as_completed.
+        """
+        await self.check_early_stop(wait_n_as_completed(20, 0.05))
+
+    async def test_wait_n_as_completed_bounded(self):
+        """
+        Teste l'arrêt anticipé de wait_n_as_completed en mode borné.
+        """
+        await self.check_early_stop(
+            wait_n_as_completed(20, 0.05, max_in_flight=5))
+
+    async def test_task_wait_n_as_completed(self):
+        """
+        Teste l'arrêt anticipé de task_wait_n_as_completed.
+        """
+        await self.check_early_stop(task_wait_n_as_completed(20, 0.05))
+
+    async def test_task_wait_n_as_completed_bounded(self):
+        """
+        Teste l'arrêt anticipé de task_wait_n_as_completed
+        en mode borné.
+        """
+        await self.check_early_stop(
+            task_wait_n_as_completed(20, 0.05, max_in_flight=5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests pour les sources de délais de wait_random.
+Auteur SAID LAMGHARI
+"""
+import asyncio
+import unittest
+
+delay_source = __import__('7-delay_source')
+DelaySource = delay_source.DelaySource
+set_delay_source = delay_source.set_delay_source
+current_delay_source = delay_source.current_delay_source
+wait_random = __import__('0-basic_async_syntax').wait_random
+
+HAS_NUMPY = delay_source._import_numpy() is not None
+
+
+class TestDelaySource(unittest.TestCase):
+    """
+    Classe de tests pour DelaySource.
+    """
+
+    def test_seeded_reproducibility(self):
+        """
+        Teste que deux sources de même graine produisent les mêmes
+        délais, et deux graines différentes des délais différents.
+        """
+        for distribution in ('uniform', 'exponential', 'lognormal'):
+            with self.subTest(distribution=distribution):
+                first = DelaySource(distribution, seed=7, batch_size=16,
+                                    use_numpy=False)
+                second = DelaySource(distribution, seed=7, batch_size=16,
+                                     use_numpy=False)
+                other = DelaySource(distribution, seed=8, batch_size=16,
+                                    use_numpy=False)
+                draws = [first.draw(10) for _ in range(100)]
+                self.assertEqual(draws,
+                                 [second.draw(10) for _ in range(100)])
+                self.assertNotEqual(draws,
+                                    [other.draw(10) for _ in range(100)])
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy n'est pas installé")
+    def test_seeded_reproducibility_numpy(self):
+        """
+        Teste la reproductibilité avec le générateur de NumPy.
+        """
+        first = DelaySource('lognormal', seed=3, use_numpy=True)
+        second = DelaySource('lognormal', seed=3, use_numpy=True)
+        self.assertEqual([first.draw(10) for _ in range(100)],
+                         [second.draw(10) for _ in range(100)])
+
+    def test_truncated_not_capped(self):
+        """
+        Teste que la queue de la loi est retirée et non empilée
+        sur max_delay.
+        """
+        source = DelaySource('exponential', seed=1, use_numpy=False)
+        draws = [source.draw(2) for _ in range(5000)]
+        self.assertTrue(all(0 <= draw < 2 for draw in draws))
+        self.assertLess(sum(draw > 1.99 for draw in draws), 50)
+
+    def test_empirical_replay_order(self):
+        """
+        Teste que la distribution empirique rejoue les échantillons
+        dans l'ordre, en boucle, en sautant ceux trop longs.
+        """
+        source = DelaySource('empirical', samples=[0.1, 0.2, 0.3],
+                             batch_size=2)
+        self.assertEqual([source.draw(1) for _ in range(7)],
+                         [0.1, 0.2, 0.3, 0.1, 0.2, 0.3, 0.1])
+        self.assertEqual([source.draw(0.25) for _ in range(3)],
+                         [0.2, 0.1, 0.2])
+        with self.assertRaises(ValueError):
+            source.draw(0.05)
+
+    def test_spawn_independence(self):
+        """
+        Teste que les sources dérivées sont reproductibles,
+        différentes entre elles et de leur parent.
+        """
+        parent = DelaySource(seed=11, use_numpy=False)
+        child_a, child_b = parent.spawn(), parent.spawn()
+        draws_a = [child_a.draw(1) for _ in range(50)]
+        draws_b = [child_b.draw(1) for _ in range(50)]
+        self.assertNotEqual(draws_a, draws_b)
+        self.assertNotEqual(draws_a, [parent.draw(1) for _ in range(50)])
+        again = DelaySource(seed=11, use_numpy=False).spawn()
+        self.assertEqual(draws_a, [again.draw(1) for _ in range(50)])
+        self.assertEqual(child_a.distribution, parent.distribution)
+
+    def test_invalid_parameters(self):
+        """
+        Teste que les paramètres invalides lèvent ValueError
+        dès la construction.
+        """
+        cases = [
+            {'distribution': 'normal'},
+            {'batch_size': 0},
+            {'distribution': 'empirical'},
+            {'distribution': 'exponential', 'mean': 0},
+            {'distribution': 'exponential', 'mean': -1},
+            {'distribution': 'lognormal', 'sigma': -0.1},
+            {'distribution': 'empirical', 'samples': [0.1, -0.2]},
+        ]
+        for kwargs in cases:
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    DelaySource(**kwargs)
+
+
+class TestLoopDelaySource(unittest.TestCase):
+    """
+    Classe de tests pour set_delay_source et current_delay_source.
+    """
+
+    def test_per_loop_pairing(self):
+        """
+        Teste que chaque boucle a sa propre source, utilisée par
+        wait_random, et que None la retire.
+        """
+        sources = [DelaySource('empirical', samples=[0.001]),
+                   DelaySource('empirical', samples=[0.002])]
+
+        async def scenario(source):
+            set_delay_source(source)
+            seen = current_delay_source()
+            delay = await wait_random(1)
+            set_delay_source(None)
+            return seen, delay, current_delay_source()
+
+        for source, expected in zip(sources, (0.001, 0.002)):
+            self.assertEqual(asyncio.run(scenario(source)),
+                             (source, expected, None))
+
+    def test_explicit_loop(self):
+        """
+        Teste l'association à une boucle qui ne tourne pas encore.
+        """
+        source = DelaySource(seed=1)
+        loop = asyncio.new_event_loop()
+        try:
+            set_delay_source(source, loop)
+
+            async def current():
+                return current_delay_source()
+
+            self.assertIs(loop.run_until_complete(current()), source)
+        finally:
+            loop.close()
+        self.assertIsNone(current_delay_source())
+
+
+if __name__ == '__main__':
+    unittest.main()
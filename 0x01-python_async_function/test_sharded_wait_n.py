@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests pour la version multi-processus de wait_n.
+Auteur SAID LAMGHARI
+"""
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sharded = __import__('9-sharded_wait_n')
+split_shards = sharded.split_shards
+sharded_wait_n = sharded.sharded_wait_n
+
+
+class TestSplitShards(unittest.TestCase):
+    """
+    Classe de tests pour split_shards.
+    """
+
+    def test_even_and_uneven(self):
+        """
+        Teste une répartition exacte puis une répartition inégale.
+        """
+        self.assertEqual(split_shards(12, 3), [4, 4, 4])
+        self.assertEqual(split_shards(10, 3), [4, 3, 3])
+
+    def test_fewer_calls_than_shards(self):
+        """
+        Teste que les shards vides sont omis.
+        """
+        self.assertEqual(split_shards(2, 5), [1, 1])
+        self.assertEqual(split_shards(0, 4), [])
+
+    def test_invalid_shards(self):
+        """
+        Teste que shards < 1 lève ValueError.
+        """
+        for shards in (0, -2):
+            with self.assertRaises(ValueError):
+                split_shards(10, shards)
+
+
+class TestShardedWaitN(unittest.IsolatedAsyncioTestCase):
+    """
+    Classe de tests pour sharded_wait_n.
+    """
+
+    async def test_merged_result(self):
+        """
+        Teste que le résultat fusionné est trié et de longueur n,
+        avec un pool injecté qui reste ouvert.
+        """
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            delays = await sharded_wait_n(25, 0.01, shards=3,
+                                          executor=pool)
+            self.assertEqual(len(delays), 25)
+            self.assertEqual(delays, sorted(delays))
+            # Le pool injecté n'est pas fermé par sharded_wait_n
+            self.assertEqual(pool.submit(int, '7').result(), 7)
+
+    async def test_invalid_shards(self):
+        """
+        Teste que shards < 1 lève ValueError.
+        """
+        with self.assertRaises(ValueError):
+            await sharded_wait_n(10, 0, shards=0)
+
+    async def test_timeout_does_not_block_loop(self):
+        """
+        Teste qu'une annulation rend la main sans attendre la fin
+        des shards déjà lancés.
+        """
+        start = time.perf_counter()
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(sharded_wait_n(4, 1, shards=2), 0.3)
+        self.assertLess(time.perf_counter() - start, 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests pour la roue temporelle hiérarchique.
+Auteur SAID LAMGHARI
+"""
+import asyncio
+import random
+import unittest
+
+timing_wheel = __import__('8-timing_wheel')
+run_virtual = __import__('6-virtual_clock').run_virtual
+
+# Tolérance sur les flottants de l'horloge
+EPSILON = 1e-9
+
+
+async def sleep_and_measure(wheel, delay):
+    """Dort delay secondes sur la roue et retourne la durée réelle."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await wheel.sleep(delay)
+    return loop.time() - start
+
+
+class TestTimingWheel(unittest.TestCase):
+    """
+    Classe de tests pour TimingWheel et wheel_sleep.
+    """
+
+    def check_delays(self, delays, tick, slots, levels):
+        """
+        Vérifie que chaque sommeil dure au moins delay et au plus
+        delay + tick, et que la roue est vide à la fin.
+        """
+        async def scenario():
+            wheel = timing_wheel.TimingWheel(
+                tick=tick, slots=slots, levels=levels)
+            measured = await asyncio.gather(
+                *(sleep_and_measure(wheel, delay) for delay in delays))
+            return measured, len(wheel)
+
+        measured, remaining = run_virtual(scenario())
+        for delay, actual in zip(delays, measured):
+            self.assertGreaterEqual(actual, delay - EPSILON)
+            self.assertLessEqual(actual, delay + tick + EPSILON)
+        self.assertEqual(remaining, 0)
+
+    def test_never_early_single_level(self):
+        """
+        Teste des délais qui tiennent dans le premier niveau.
+        """
+        rng = random.Random(1)
+        self.check_delays([rng.uniform(0, 0.04) for _ in range(500)],
+                          tick=0.01, slots=4, levels=1)
+
+    def test_cascade_and_overflow(self):
+        """
+        Teste des délais qui traversent plusieurs niveaux et
+        dépassent la portée de la roue (0.16 s ici).
+        """
+        rng = random.Random(2)
+        delays = [rng.uniform(0, 2) for _ in range(1000)]
+        delays += [0.04, 0.16, 0.17, 1.0]
+        self.check_delays(delays, tick=0.01, slots=4, levels=2)
+
+    def test_staggered_sleepers(self):
+        """
+        Teste des sommeils insérés alors que la roue tourne déjà.
+        """
+        async def scenario():
+            wheel = timing_wheel.TimingWheel(tick=0.01, slots=4, levels=2)
+            results = []
+
+            async def sleeper(offset, delay):
+                await asyncio.sleep(offset)
+                results.append(
+                    (delay, await sleep_and_measure(wheel, delay)))
+
+            await asyncio.gather(*(sleeper(i * 0.037, 0.5 - i * 0.03)
+                                   for i in range(15)))
+            return results
+
+        for delay, actual in run_virtual(scenario()):
+            self.assertGreaterEqual(actual, delay - EPSILON)
+            self.assertLessEqual(actual, delay + 0.01 + EPSILON)
+
+    def test_cancelled_sleepers(self):
+        """
+        Teste que les sommeils annulés sont ignorés sans erreur
+        et n'empêchent pas les autres de se réveiller.
+        """
+        async def scenario():
+            wheel = timing_wheel.TimingWheel(tick=0.01, slots=4, levels=2)
+            futures = [wheel.sleep(0.05 * (i + 1)) for i in range(10)]
+            for future in futures[::2]:
+                future.cancel()
+            await asyncio.gather(*futures[1::2])
+            # Laisse la roue dépasser les échéances annulées
+            await asyncio.sleep(1)
+            return ([future.cancelled() for future in futures],
+                    len(wheel), wheel._handle)
+
+        cancelled, remaining, handle = run_virtual(scenario())
+        self.assertEqual(cancelled, [True, False] * 5)
+        self.assertEqual(remaining, 0)
+        self.assertIsNone(handle)
+
+    def test_zero_delay(self):
+        """
+        Teste qu'un délai nul ou négatif est résolu immédiatement.
+        """
+        async def scenario():
+            wheel = timing_wheel.TimingWheel()
+            return wheel.sleep(0).done(), wheel.sleep(-1).done(), len(wheel)
+
+        self.assertEqual(run_virtual(scenario()), (True, True, 0))
+
+    def test_invalid_parameters(self):
+        """
+        Teste que des paramètres non positifs lèvent ValueError.
+        """
+        async def scenario():
+            for kwargs in ({'tick': 0}, {'slots': 1}, {'levels': 0}):
+                with self.assertRaises(ValueError):
+                    timing_wheel.TimingWheel(**kwargs)
+
+        run_virtual(scenario())
+
+    def test_wheel_sleep_shares_loop_wheel(self):
+        """
+        Teste que wheel_sleep utilise une seule roue par boucle.
+        """
+        async def scenario():
+            await timing_wheel.wheel_sleep(0.01)
+            first = timing_wheel.get_timing_wheel()
+            await timing_wheel.wheel_sleep(0.01)
+            return first is timing_wheel.get_timing_wheel()
+
+        self.assertTrue(run_virtual(scenario()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests pour la boucle d'événements à horloge virtuelle.
+Auteur SAID LAMGHARI
+"""
+import asyncio
+import time
+import unittest
+
+virtual_clock = __import__('6-virtual_clock')
+wait_n = __import__('1-concurrent_coroutines').wait_n
+
+
+class TestVirtualClockEventLoop(unittest.TestCase):
+    """
+    Classe de tests pour VirtualClockEventLoop et run_virtual.
+    """
+
+    def test_sleep_deltas_are_exact(self):
+        """
+        Teste que loop.time() avance exactement de la durée
+        de chaque sommeil.
+        """
+        async def deltas():
+            loop = asyncio.get_running_loop()
+            measured = []
+            for delay in (0.5, 1.25, 3600.0, 0.0):
+                start = loop.time()
+                await asyncio.sleep(delay)
+                measured.append(loop.time() - start)
+            return measured
+
+        self.assertEqual(virtual_clock.run_virtual(deltas()),
+                         [0.5, 1.25, 3600.0, 0.0])
+
+    def test_no_real_waiting(self):
+        """
+        Teste qu'une heure de sommeil ne prend pas de temps réel.
+        """
+        start = time.perf_counter()
+        virtual_clock.run_virtual(asyncio.sleep(3600))
+        self.assertLess(time.perf_counter() - start, 1)
+
+    def test_start_and_concurrent_sleepers(self):
+        """
+        Teste que des sommeils concurrents se recouvrent : la durée
+        totale est celle du plus long, à partir de start.
+        """
+        async def total():
+            loop = asyncio.get_running_loop()
+            delays = await wait_n(200, 10)
+            return loop.time(), delays
+
+        end, delays = virtual_clock.run_virtual(total(), start=100.0)
+        self.assertEqual(len(delays), 200)
+        self.assertEqual(delays, sorted(delays))
+        self.assertAlmostEqual(end, 100.0 + max(delays))
+
+    def test_advance_backwards(self):
+        """
+        Teste que l'horloge virtuelle refuse de reculer.
+        """
+        loop = virtual_clock.VirtualClockEventLoop()
+        try:
+            loop.advance(2)
+            self.assertEqual(loop.time(), 2)
+            with self.assertRaises(ValueError):
+                loop.advance(-1)
+        finally:
+            loop.close()
+
+    def test_policy(self):
+        """
+        Teste que la politique crée des boucles virtuelles.
+        """
+        policy = virtual_clock.VirtualClockEventLoopPolicy()
+        loop = policy.new_event_loop()
+        try:
+            self.assertIsInstance(loop,
+                                  virtual_clock.VirtualClockEventLoop)
+        finally:
+            loop.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
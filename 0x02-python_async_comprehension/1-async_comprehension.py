@@ -4,19 +4,32 @@ Auteur SAID LAMGHARI
 """
 
 import asyncio
-from typing import List
+from typing import AsyncIterable, List, Optional
 # Assurez-vous que le chemin d'importation est correct
 async_generator = __import__('0-async_generator').async_generator
+# Importe le pipeline du fichier 4-pipeline.py
+Pipeline = __import__('4-pipeline').Pipeline
 
 
-async def async_comprehension() -> List[float]:
+async def async_comprehension(
+        source: Optional[AsyncIterable[float]] = None) -> List[float]:
     """
     Utilise une compréhension asynchrone pour collecter
     10 nombres aléatoires générés par async_generator.
 
+    La collecte est l'étape terminale d'un Pipeline : le
+    générateur tourne dans sa propre tâche, derrière une file bornée.
+
+    Args:
+        source (Optional[AsyncIterable[float]]): Flux à collecter à
+        la place de async_generator(), par exemple flatten() d'un
+        générateur par blocs.
+
     Returns:
         List[float]: Liste de 10 nombres aléatoires.
     """
-    # Utilisation de la compréhension asynchrone
+    if source is None:
+        source = async_generator()
+    # L'étape collect utilise la compréhension asynchrone
     # pour collecter les résultats de async_generator
-    return [ik async for ik in async_generator()]
+    return await Pipeline(source).collect()
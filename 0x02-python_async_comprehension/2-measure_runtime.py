@@ -4,7 +4,10 @@ Auteur SAID LAMGHARI
 """
 import time
 import asyncio
+from typing import Tuple
 async_comprehension = __import__('1-async_comprehension').async_comprehension
+async_generator = __import__('0-async_generator').async_generator
+aggregates = __import__('7-aggregates')
 
 
 async def measure_runtime() -> float:
@@ -21,3 +24,23 @@ async def measure_runtime() -> float:
     await asyncio.gather(*val_tsk)
     end_tme = time.perf_counter()
     return (end_tme - start_tme)
+
+
+async def measure_runtime_stats() -> Tuple[float, 'aggregates.StreamStats']:
+    """
+    Comme measure_runtime, mais agrège les quatre flux au fil de
+    l'eau au lieu de construire quatre listes, puis fusionne
+    leurs statistiques.
+
+    Returns:
+        Tuple[float, StreamStats]: Temps total d'exécution en
+        secondes et statistiques combinées des quatre flux.
+    """
+    start_tme = time.perf_counter()
+    val_stats = await asyncio.gather(
+        *(aggregates.aggregate(async_generator()) for i in range(4)))
+    combined = aggregates.StreamStats()
+    for stats in val_stats:
+        combined.merge(stats)
+    end_tme = time.perf_counter()
+    return (end_tme - start_tme), combined
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Générateur asynchrone par blocs et adaptateur d'aplatissement.
+
+async_generator paie une reprise de générateur et un tour de
+boucle par valeur. async_generator_chunked produit les valeurs
+par blocs array('d') : un seul sommeil et une seule reprise par
+bloc, à débit égal (interval secondes par valeur).
+
+Utilisation :
+    chunked = __import__('3-chunked_generator').async_generator_chunked
+    flatten = __import__('3-chunked_generator').flatten
+
+    async for block in chunked(count=100000, interval=0, chunk_size=4096):
+        total += sum(block)
+    values = await async_comprehension(flatten(chunked(count=10)))
+
+Auteur SAID LAMGHARI
+"""
+
+import asyncio
+import random
+from array import array
+from typing import AsyncIterable, AsyncIterator, Union
+
+Chunk = Union[array, memoryview]
+
+
+async def async_generator_chunked(count: int = 10, interval: float = 1.0,
+                                  chunk_size: int = 1024,
+                                  as_memoryview: bool = False
+                                  ) -> AsyncIterator[Chunk]:
+    """
+    Générateur asynchrone qui produit count nombres aléatoires
+    entre 0 et 10, par blocs d'au plus chunk_size valeurs.
+
+    Args:
+        count (int): Nombre total de valeurs.
+        interval (float): Temps de production d'une valeur, en
+        secondes ; chaque bloc attend interval * len(bloc).
+        chunk_size (int): Taille maximale d'un bloc.
+        as_memoryview (bool): Si vrai, produit des memoryview sur un
+        tampon unique réutilisé : chaque vue n'est valide que
+        jusqu'au bloc suivant, sans aucune allocation par bloc.
+
+    Yields:
+        Chunk: Un bloc array('d'), ou une memoryview sur le tampon.
+
+    Raises:
+        ValueError: Si chunk_size est inférieur à 1.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size doit être supérieur ou égal à 1")
+    rand = random.random
+    if as_memoryview:
+        buffer = array('d', bytes(8 * max(0, min(count, chunk_size))))
+        view = memoryview(buffer)
+    remaining = count
+    while remaining > 0:
+        size = min(remaining, chunk_size)
+        remaining -= size
+        # Attendre de manière asynchrone la production du bloc
+        await asyncio.sleep(interval * size)
+        if as_memoryview:
+            # Remplissage en place : le tampon exporté n'est pas réalloué
+            for index in range(size):
+                buffer[index] = rand() * 10
+            yield view[:size]
+        else:
+            yield array('d', [rand() * 10 for _ in range(size)])
+
+
+async def flatten(chunks: AsyncIterable[Chunk]) -> AsyncIterator[float]:
+    """
+    Aplatit un flux de blocs en flux de valeurs, pour les
+    consommateurs valeur par valeur comme async_comprehension.
+
+    Args:
+        chunks (AsyncIterable[Chunk]): Flux de blocs.
+
+    Yields:
+        float: Chaque valeur, dans l'ordre.
+    """
+    async for chunk in chunks:
+        for value in chunk:
+            yield value
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Petit cadre de pipeline asynchrone construit sur async_generator.
+
+Chaque étape (map, filter, batch, window) tourne dans sa propre
+tâche et communique avec la suivante par une asyncio.Queue bornée :
+un consommateur lent bloque les put() en amont et freine donc le
+producteur (contre-pression), et les sommeils du producteur se
+recouvrent avec le travail des étapes en aval.
+
+Une étape terminale (collect ou sink) lance le pipeline. Si une
+étape échoue, toutes les autres sont annulées et l'exception est
+propagée.
+
+Utilisation :
+    Pipeline = __import__('4-pipeline').Pipeline
+
+    sums = await (Pipeline(async_generator(), maxsize=4)
+                  .filter(lambda x: x > 5)
+                  .batch(3)
+                  .map(sum)
+                  .collect())
+
+Auteur SAID LAMGHARI
+"""
+
+import asyncio
+import collections
+import inspect
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    List)
+
+# Marqueur de fin de flux transmis d'une étape à l'autre
+_END = object()
+
+Stage = Callable[[asyncio.Queue, asyncio.Queue], Awaitable[None]]
+
+
+async def _call(func: Callable[[Any], Any], item: Any) -> Any:
+    """
+    Appelle une fonction synchrone ou asynchrone.
+
+    Args:
+        func (Callable): La fonction.
+        item (Any): Son argument.
+
+    Returns:
+        Any: Le résultat, attendu s'il est attendable.
+    """
+    result = func(item)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def _drain(queue: asyncio.Queue) -> AsyncIterator[Any]:
+    """
+    Lit une file jusqu'au marqueur de fin.
+
+    Args:
+        queue (asyncio.Queue): La file à vider.
+
+    Yields:
+        Any: Chaque élément de la file.
+    """
+    while True:
+        item = await queue.get()
+        if item is _END:
+            return
+        yield item
+
+
+class Pipeline:
+    """
+    Chaîne d'étapes asynchrones reliées par des files bornées.
+    """
+
+    def __init__(self, source: AsyncIterable[Any], maxsize: int = 16) -> None:
+        """
+        Args:
+            source (AsyncIterable[Any]): Flux d'entrée, par exemple
+            async_generator().
+            maxsize (int): Capacité de chaque file entre deux étapes.
+
+        Raises:
+            ValueError: Si maxsize est inférieur à 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize doit être supérieur ou égal à 1")
+        self._source = source
+        self._maxsize = maxsize
+        self._stages: List[Stage] = []
+
+    def _then(self, stage: Stage) -> 'Pipeline':
+        """Ajoute une étape et retourne le pipeline pour chaîner."""
+        self._stages.append(stage)
+        return self
+
+    def map(self, func: Callable[[Any], Any]) -> 'Pipeline':
+        """
+        Applique func, synchrone ou asynchrone, à chaque élément.
+
+        Args:
+            func (Callable): Fonction de transformation.
+
+        Returns:
+            Pipeline: Le pipeline, pour chaîner les étapes.
+        """
+        async def stage(inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+            async for item in _drain(inbox):
+                await outbox.put(await _call(func, item))
+        return self._then(stage)
+
+    def filter(self, predicate: Callable[[Any], Any]) -> 'Pipeline':
+        """
+        Ne garde que les éléments pour lesquels predicate est vrai.
+
+        Args:
+            predicate (Callable): Prédicat synchrone ou asynchrone.
+
+        Returns:
+            Pipeline: Le pipeline, pour chaîner les étapes.
+        """
+        async def stage(inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+            async for item in _drain(inbox):
+                if await _call(predicate, item):
+                    await outbox.put(item)
+        return self._then(stage)
+
+    def batch(self, size: int) -> 'Pipeline':
+        """
+        Regroupe les éléments en listes d'au plus size éléments ;
+        le dernier lot peut être incomplet.
+
+        Args:
+            size (int): Taille des lots.
+
+        Returns:
+            Pipeline: Le pipeline, pour chaîner les étapes.
+        """
+        if size < 1:
+            raise ValueError("size doit être supérieur ou égal à 1")
+
+        async def stage(inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+            current: List[Any] = []
+            async for item in _drain(inbox):
+                current.append(item)
+                if len(current) == size:
+                    await outbox.put(current)
+                    current = []
+            if current:
+                await outbox.put(current)
+        return self._then(stage)
+
+    def window(self, size: int, step: int = 1) -> 'Pipeline':
+        """
+        Produit des fenêtres glissantes complètes (tuples de size
+        éléments), une tous les step éléments.
+
+        Args:
+            size (int): Taille des fenêtres.
+            step (int): Décalage entre deux fenêtres.
+
+        Returns:
+            Pipeline: Le pipeline, pour chaîner les étapes.
+        """
+        if size < 1 or step < 1:
+            raise ValueError("size et step doivent être supérieurs à 0")
+
+        async def stage(inbox: asyncio.Queue, outbox: asyncio.Queue) -> None:
+            recent: collections.deque = collections.deque(maxlen=size)
+            seen = 0
+            async for item in _drain(inbox):
+                recent.append(item)
+                seen += 1
+                if seen >= size and (seen - size) % step == 0:
+                    await outbox.put(tuple(recent))
+        return self._then(stage)
+
+    async def _run(self, terminal: Callable[[asyncio.Queue],
+                                            Awaitable[Any]]) -> Any:
+        """
+        Lance toutes les étapes et l'étape terminale.
+
+        Args:
+            terminal (Callable): Coroutine qui consomme la dernière file.
+
+        Returns:
+            Any: Le résultat de l'étape terminale.
+        """
+        queues = [asyncio.Queue(self._maxsize)
+                  for _ in range(len(self._stages) + 1)]
+
+        async def run_stage(stage: Stage, index: int) -> None:
+            await stage(queues[index], queues[index + 1])
+            await queues[index + 1].put(_END)
+
+        async def feed() -> None:
+            # Copie le flux source dans la première file
+            async for item in self._source:
+                await queues[0].put(item)
+            await queues[0].put(_END)
+
+        tasks = [asyncio.ensure_future(feed())]
+        tasks += [asyncio.ensure_future(run_stage(stage, index))
+                  for index, stage in enumerate(self._stages)]
+        tasks.append(asyncio.ensure_future(terminal(queues[-1])))
+        try:
+            done, _ = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+            return tasks[-1].result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def collect(self) -> List[Any]:
+        """
+        Étape terminale : collecte tous les éléments dans une liste.
+
+        Returns:
+            List[Any]: Les éléments, dans l'ordre.
+        """
+        async def terminal(inbox: asyncio.Queue) -> List[Any]:
+            return [item async for item in _drain(inbox)]
+        return await self._run(terminal)
+
+    async def sink(self, func: Callable[[Any], Any]) -> None:
+        """
+        Étape terminale : passe chaque élément à func,
+        synchrone ou asynchrone.
+
+        Args:
+            func (Callable): Fonction appelée pour chaque élément.
+        """
+        async def terminal(inbox: asyncio.Queue) -> None:
+            async for item in _drain(inbox):
+                await _call(func, item)
+        await self._run(terminal)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Fusion de plusieurs flux asynchrones en un seul.
+
+merge entrelace les flux dans l'ordre d'arrivée des valeurs :
+une tâche par source alimente une file commune bornée au nombre
+de sources, si bien que la mémoire dépend du nombre de sources et
+non du nombre total de valeurs. merge_ordered fusionne des flux
+déjà triés : chaque source a aussi sa tâche de pompage, qui garde
+au plus maxsize valeurs d'avance, et la fusion k-voies porte sur
+les têtes de ces files. Avec stamp=True, la tâche de pompage
+horodate chaque valeur au moment où la source la produit.
+
+Dans les deux cas, dès que le flux fusionné est fermé (aclose(),
+annulation pendant l'attente d'une valeur, ou finalisation par la
+boucle après un break), les tâches de pompage sont annulées et les
+sources fermées.
+
+Utilisation :
+    merge = __import__('5-merge').merge
+
+    # Les quatre async_generator de measure_runtime, consommés
+    # au fil de l'eau au lieu de construire quatre listes
+    async for value in merge(*(async_generator() for _ in range(4))):
+        ...
+
+Auteur SAID LAMGHARI
+"""
+
+import asyncio
+import heapq
+import operator
+from typing import (Any, AsyncIterable, AsyncIterator, Callable, List,
+                    Optional, Sequence, Tuple)
+
+# Marqueur de fin transmis par les tâches de pompage (partagé avec
+# 6-prefetch.py)
+END = object()
+
+
+class SourceFailure:
+    """Enveloppe l'exception levée par une source."""
+
+    def __init__(self, exc: BaseException) -> None:
+        """
+        Args:
+            exc (BaseException): L'exception de la source.
+        """
+        self.exc = exc
+
+
+async def pump(source: AsyncIterable[Any], queue: asyncio.Queue,
+               stamp: bool = False) -> None:
+    """
+    Recopie une source dans une file, suivie du marqueur END ; une
+    exception de la source est transmise enveloppée dans un
+    SourceFailure.
+
+    Args:
+        source (AsyncIterable[Any]): La source.
+        queue (asyncio.Queue): La file à remplir.
+        stamp (bool): Si vrai, place des couples (loop.time(), valeur)
+        horodatés dès que la source produit la valeur.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        async for item in source:
+            await queue.put((loop.time(), item) if stamp else item)
+    except Exception as exc:
+        await queue.put(SourceFailure(exc))
+    else:
+        await queue.put(END)
+
+
+async def close_pumps(tasks: Sequence[asyncio.Future],
+                      sources: Sequence[AsyncIterable[Any]]) -> None:
+    """
+    Annule les tâches de pompage, attend leur fin puis ferme
+    les sources.
+
+    Args:
+        tasks (Sequence[asyncio.Future]): Les tâches de pompage.
+        sources (Sequence[AsyncIterable[Any]]): Les sources.
+    """
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    for source in sources:
+        aclose = getattr(source, 'aclose', None)
+        if aclose is not None:
+            await aclose()
+
+
+async def merge(*sources: AsyncIterable[Any],
+                maxsize: Optional[int] = None) -> AsyncIterator[Any]:
+    """
+    Entrelace plusieurs flux dans l'ordre d'arrivée.
+
+    Args:
+        *sources (AsyncIterable[Any]): Flux à fusionner.
+        maxsize (Optional[int]): Capacité de la file commune,
+        par défaut le nombre de sources.
+
+    Yields:
+        Any: Chaque valeur, dès qu'une source la produit.
+
+    Raises:
+        Exception: La première exception levée par une source ; les
+        autres sources sont alors annulées.
+    """
+    if not sources:
+        return
+    queue: asyncio.Queue = asyncio.Queue(maxsize or len(sources))
+    tasks = [asyncio.ensure_future(pump(source, queue))
+             for source in sources]
+    try:
+        running = len(tasks)
+        while running:
+            item = await queue.get()
+            if item is END:
+                running -= 1
+            elif isinstance(item, SourceFailure):
+                raise item.exc
+            else:
+                yield item
+    finally:
+        await close_pumps(tasks, sources)
+
+
+async def merge_ordered(*sources: AsyncIterable[Any],
+                        key: Optional[Callable[[Any], Any]] = None,
+                        stamp: bool = False,
+                        maxsize: int = 1) -> AsyncIterator[Any]:
+    """
+    Fusionne des flux déjà triés en un flux trié (fusion k-voies).
+
+    Toutes les sources avancent en parallèle, chacune dans sa tâche
+    de pompage : la durée totale est celle de la source la plus
+    lente, pas la somme des sources. Une fusion k-voies doit
+    toutefois attendre la valeur suivante de la source qu'elle
+    vient de vider ; si les clés n'avancent pas au rythme de la
+    production (valeurs aléatoires, débits inégaux), augmenter
+    maxsize permet aux autres sources de prendre de l'avance.
+
+    Args:
+        *sources (AsyncIterable[Any]): Flux triés selon key.
+        key (Optional[Callable]): Clé de tri, par défaut la valeur,
+        ou l'horodatage si stamp est vrai.
+        stamp (bool): Si vrai, chaque valeur est horodatée par sa
+        tâche de pompage au moment où la source la produit, et le
+        flux fusionné contient des couples (loop.time(), valeur).
+        maxsize (int): Nombre de valeurs gardées d'avance par source.
+
+    Yields:
+        Any: Les valeurs de tous les flux, dans l'ordre de key.
+
+    Raises:
+        ValueError: Si maxsize est inférieur à 1.
+        Exception: La première exception levée par une source.
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize doit être supérieur ou égal à 1")
+    if key is None:
+        key = operator.itemgetter(0) if stamp else (lambda item: item)
+    queues = [asyncio.Queue(maxsize) for _ in sources]
+    tasks = [asyncio.ensure_future(pump(source, queue, stamp))
+             for source, queue in zip(sources, queues)]
+    heap: List[Tuple[Any, int, Any]] = []
+
+    async def push_head(index: int) -> None:
+        """Attend la prochaine valeur d'une source et la range."""
+        item = await queues[index].get()
+        if isinstance(item, SourceFailure):
+            raise item.exc
+        if item is not END:
+            heapq.heappush(heap, (key(item), index, item))
+
+    try:
+        # Une tête par source est nécessaire avant de produire
+        for index in range(len(queues)):
+            await push_head(index)
+        while heap:
+            _, index, item = heapq.heappop(heap)
+            yield item
+            await push_head(index)
+    finally:
+        await close_pumps(tasks, sources)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Lecture anticipée pour générateurs asynchrones.
+
+prefetch fait tourner la source dans une tâche d'arrière-plan qui
+garde jusqu'à depth valeurs d'avance dans une file ; quand la file
+est pleine, la tâche a encore en main la valeur suivante, qu'elle
+attend de pouvoir y déposer. Au plus depth + 1 valeurs sont donc
+lues d'avance. Le sommeil du
+producteur (une seconde par valeur pour async_generator) se recouvre
+ainsi avec le traitement du consommateur au lieu de s'y ajouter.
+
+Les exceptions de la source sont relancées chez le consommateur au
+moment où il atteint la valeur fautive. Dès que prefetch est fermé,
+la tâche de lecture est annulée et la source fermée : tout de suite
+sur aclose() ou si l'annulation survient pendant l'attente d'une
+valeur ; après un break, seulement quand la boucle finalise le
+générateur abandonné (utiliser aclose() pour un arrêt immédiat).
+
+Utilisation :
+    prefetch = __import__('6-prefetch').prefetch
+
+    async for value in prefetch(async_generator(), depth=2):
+        await traiter(value)
+
+Auteur SAID LAMGHARI
+"""
+
+import asyncio
+from typing import Any, AsyncIterable, AsyncIterator
+# Importe la tâche de pompage partagée du fichier 5-merge.py
+merge = __import__('5-merge')
+
+
+async def prefetch(source: AsyncIterable[Any],
+                   depth: int = 1) -> AsyncIterator[Any]:
+    """
+    Itère sur source en lisant jusqu'à depth + 1 valeurs d'avance.
+
+    Args:
+        source (AsyncIterable[Any]): Flux à lire par anticipation.
+        depth (int): Capacité de la file ; la tâche de lecture peut
+        tenir une valeur de plus en attendant une place.
+
+    Yields:
+        Any: Les valeurs de la source, dans l'ordre.
+
+    Raises:
+        ValueError: Si depth est inférieur à 1.
+    """
+    if depth < 1:
+        raise ValueError("depth doit être supérieur ou égal à 1")
+    queue: asyncio.Queue = asyncio.Queue(depth)
+    task = asyncio.ensure_future(merge.pump(source, queue))
+    try:
+        while True:
+            item = await queue.get()
+            if item is merge.END:
+                return
+            if isinstance(item, merge.SourceFailure):
+                raise item.exc
+            yield item
+    finally:
+        await merge.close_pumps([task], [source])
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Agrégats en flux, en mémoire constante, sur des flux asynchrones.
+
+StreamStats calcule au fil de l'eau le nombre de valeurs, leur
+somme compensée (Neumaier), le minimum, le maximum, la moyenne et
+la variance (Welford), et des quantiles approchés grâce à un
+QuantileSketch à erreur relative bornée. Tous les agrégats sont
+fusionnables : des flux traités en parallèle se combinent sans
+qu'aucune liste de valeurs ne soit conservée.
+
+Utilisation :
+    aggregate = __import__('7-aggregates').aggregate
+
+    stats = await aggregate(async_generator())
+    print(stats.to_dict())
+
+Auteur SAID LAMGHARI
+"""
+
+import math
+from typing import Any, AsyncIterable, Dict, Optional
+
+
+class QuantileSketch:
+    """
+    Esquisse de quantiles à erreur relative bornée (type DDSketch).
+
+    Chaque valeur positive x est rangée dans le seau
+    ceil(log_gamma(x)) ; la mémoire dépend de l'étendue des valeurs
+    (log(max / min) / log(gamma) seaux), pas de leur nombre.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01,
+                 min_value: float = 1e-9) -> None:
+        """
+        Args:
+            relative_accuracy (float): Erreur relative maximale.
+            min_value (float): Valeurs absolues plus petites traitées
+            comme zéro.
+
+        Raises:
+            ValueError: Si relative_accuracy n'est pas dans ]0, 1[.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy doit être dans ]0, 1[")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _key(self, value: float) -> int:
+        """Retourne le seau d'une valeur absolue >= min_value."""
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        """Retourne le représentant d'un seau (erreur relative bornée)."""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def add(self, value: float) -> None:
+        """
+        Ajoute une valeur à l'esquisse.
+
+        Args:
+            value (float): La valeur.
+        """
+        self.count += 1
+        if value > self.min_value:
+            buckets, magnitude = self._positive, value
+        elif value < -self.min_value:
+            buckets, magnitude = self._negative, -value
+        else:
+            self.zero_count += 1
+            return
+        key = self._key(magnitude)
+        buckets[key] = buckets.get(key, 0) + 1
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Ajoute le contenu d'une esquisse de même précision.
+
+        Args:
+            other (QuantileSketch): L'esquisse à fusionner.
+
+        Raises:
+            ValueError: Si les précisions diffèrent.
+        """
+        if other._gamma != self._gamma:
+            raise ValueError("esquisses de précisions différentes")
+        for mine, theirs in ((self._positive, other._positive),
+                             (self._negative, other._negative)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """
+        Estime le quantile q.
+
+        Args:
+            q (float): Quantile voulu, entre 0 et 1.
+
+        Returns:
+            float: La valeur estimée, ou nan si l'esquisse est vide.
+        """
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self._positive))
+
+
+class StreamStats:
+    """
+    Statistiques fusionnables calculées en une passe.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """
+        Args:
+            relative_accuracy (float): Précision de l'esquisse
+            de quantiles.
+        """
+        self.count = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def _add_to_sum(self, value: float) -> None:
+        """Somme compensée de Neumaier."""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def update(self, value: float) -> None:
+        """
+        Ajoute une valeur.
+
+        Args:
+            value (float): La valeur.
+        """
+        self.count += 1
+        self._add_to_sum(value)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        # Algorithme de Welford
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.sketch.add(value)
+
+    def merge(self, other: 'StreamStats') -> None:
+        """
+        Fusionne les statistiques d'un autre flux.
+
+        Args:
+            other (StreamStats): Les statistiques à fusionner.
+        """
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        # Formule de Chan et al. pour combiner deux variances
+        self._m2 += (other._m2
+                     + delta * delta * self.count * other.count / total)
+        self.mean += delta * other.count / total
+        self.count = total
+        self._add_to_sum(other._sum)
+        self._add_to_sum(other._compensation)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def sum(self) -> float:
+        """Somme compensée des valeurs."""
+        return self._sum + self._compensation
+
+    @property
+    def variance(self) -> float:
+        """Variance d'échantillon (nan pour moins de deux valeurs)."""
+        if self.count < 2:
+            return math.nan
+        return self._m2 / (self.count - 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Exporte un résumé.
+
+        Returns:
+            Dict[str, Any]: count, sum, min, max, mean,
+            variance, p50, p90 et p99.
+        """
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.mean,
+            'variance': self.variance,
+            'p50': self.sketch.quantile(0.5),
+            'p90': self.sketch.quantile(0.9),
+            'p99': self.sketch.quantile(0.99),
+        }
+
+
+async def aggregate(stream: AsyncIterable[float],
+                    stats: Optional[StreamStats] = None) -> StreamStats:
+    """
+    Consomme un flux asynchrone en mémoire constante.
+
+    Args:
+        stream (AsyncIterable[float]): Le flux, par exemple
+        async_generator().
+        stats (Optional[StreamStats]): Statistiques à compléter,
+        nouvelles par défaut.
+
+    Returns:
+        StreamStats: Les statistiques du flux.
+    """
+    if stats is None:
+        stats = StreamStats()
+    update = stats.update
+    async for value in stream:
+        update(value)
+    return stats
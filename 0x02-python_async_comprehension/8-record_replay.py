@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Enregistrement et relecture de flux asynchrones.
+
+Un enregistrement est un fichier binaire compact : un en-tête de
+16 octets (signature, version, ordre des octets, nombre de valeurs)
+suivi de couples de doubles (valeur, intervalle depuis la valeur
+précédente, en secondes). Replay projette le fichier en mémoire
+(mmap) et expose les valeurs et les intervalles sous forme de
+memoryview, sans copie. Le flux peut être rejoué au rythme
+d'origine ou aussi vite que possible.
+
+Utilisation :
+    record = __import__('8-record_replay').record
+    Replay = __import__('8-record_replay').Replay
+
+    await record(async_generator(), 'scenario.bin')
+    with Replay('scenario.bin') as replay:
+        values = await async_comprehension(replay.stream(realtime=False))
+
+Auteur SAID LAMGHARI
+"""
+
+import asyncio
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, AsyncIterable, AsyncIterator
+
+MAGIC = b'AGRR'
+VERSION = 1
+# Signature, version, ordre des octets ('<' ou '>'), nombre de valeurs
+_HEADER = struct.Struct('<4sBc2xQ')
+_BYTEORDER = b'<' if sys.byteorder == 'little' else b'>'
+# Relecture sans attente : rend la main à la boucle toutes les
+# _YIELD_EVERY valeurs
+_YIELD_EVERY = 1024
+
+
+async def recording(stream: AsyncIterable[float], path: str,
+                    flush_every: int = 4096) -> AsyncIterator[float]:
+    """
+    Relaie un flux tout en l'enregistrant dans path.
+
+    L'en-tête est finalisé à la fin du flux, ou à la fermeture
+    du générateur si le consommateur s'arrête avant.
+
+    Args:
+        stream (AsyncIterable[float]): Le flux à enregistrer.
+        path (str): Chemin du fichier à créer.
+        flush_every (int): Nombre de valeurs gardées en mémoire
+        avant écriture sur disque.
+
+    Yields:
+        float: Chaque valeur du flux, inchangée.
+    """
+    loop = asyncio.get_running_loop()
+    buffer = array('d')
+    count = 0
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, _BYTEORDER, 0))
+        previous = loop.time()
+        try:
+            async for value in stream:
+                now = loop.time()
+                buffer.append(value)
+                buffer.append(now - previous)
+                previous = now
+                count += 1
+                if len(buffer) >= 2 * flush_every:
+                    buffer.tofile(file)
+                    del buffer[:]
+                yield value
+        finally:
+            buffer.tofile(file)
+            file.seek(0)
+            file.write(_HEADER.pack(MAGIC, VERSION, _BYTEORDER, count))
+
+
+async def record(stream: AsyncIterable[float], path: str) -> int:
+    """
+    Enregistre tout un flux dans path.
+
+    Args:
+        stream (AsyncIterable[float]): Le flux à enregistrer.
+        path (str): Chemin du fichier à créer.
+
+    Returns:
+        int: Nombre de valeurs enregistrées.
+    """
+    count = 0
+    async for _ in recording(stream, path):
+        count += 1
+    return count
+
+
+class Replay:
+    """
+    Enregistrement projeté en mémoire, prêt à être rejoué.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): Chemin de l'enregistrement.
+
+        Raises:
+            ValueError: Si le fichier n'est pas un enregistrement
+            valide pour cette machine.
+        """
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        try:
+            if len(self._map) < _HEADER.size:
+                raise ValueError("enregistrement invalide : " + path)
+            magic, version, byteorder, count = _HEADER.unpack_from(
+                self._map)
+            end = _HEADER.size + 16 * count
+            if magic != MAGIC or version != VERSION or len(self._map) < end:
+                raise ValueError("enregistrement invalide : " + path)
+            if byteorder != _BYTEORDER:
+                raise ValueError("ordre des octets incompatible : " + path)
+        except BaseException:
+            self._map.close()
+            self._file.close()
+            raise
+        self._view = memoryview(self._map)[_HEADER.size:end].cast('d')
+        # Vues à pas de 2 sur le même tampon : aucune copie
+        self.values = self._view[0::2]
+        self.intervals = self._view[1::2]
+
+    def __len__(self) -> int:
+        """Nombre de valeurs enregistrées."""
+        return len(self.values)
+
+    def __enter__(self) -> 'Replay':
+        """Retourne l'enregistrement ouvert."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Ferme l'enregistrement."""
+        self.close()
+
+    async def stream(self, realtime: bool = True,
+                     speed: float = 1.0) -> AsyncIterator[float]:
+        """
+        Rejoue les valeurs enregistrées.
+
+        Args:
+            realtime (bool): Si vrai, respecte les intervalles
+            d'origine ; sinon produit les valeurs sans attendre.
+            speed (float): Facteur d'accélération en temps réel,
+            strictement positif.
+
+        Yields:
+            float: Chaque valeur, dans l'ordre d'enregistrement.
+
+        Raises:
+            ValueError: Si speed n'est pas strictement positif.
+        """
+        if not speed > 0:
+            raise ValueError("speed doit être strictement positif")
+        values = self.values
+        if not realtime:
+            for index in range(len(values)):
+                if index and not index % _YIELD_EVERY:
+                    await asyncio.sleep(0)
+                yield values[index]
+            return
+        intervals = self.intervals
+        loop = asyncio.get_running_loop()
+        # Échéances absolues : les retards de réveil et le temps passé
+        # chez le consommateur ne s'additionnent pas d'une valeur à
+        # l'autre
+        start = loop.time()
+        target = 0.0
+        for index in range(len(values)):
+            target += intervals[index] / speed
+            await asyncio.sleep(max(0.0, start + target - loop.time()))
+            yield values[index]
+
+    def close(self) -> None:
+        """
+        Libère les vues puis ferme la projection et le fichier.
+
+        Une vue dérivée encore utilisée (par exemple values[:3])
+        empêche de fermer la projection : le fichier est tout de
+        même fermé, et close() peut être rappelé une fois ces vues
+        libérées.
+
+        Raises:
+            BufferError: Si des vues dérivées de values ou
+            intervals sont encore utilisées.
+        """
+        if self._map.closed:
+            return
+        for view in (self.values, self.intervals, self._view):
+            view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            raise BufferError(
+                "vues dérivées de values ou intervals encore utilisées :"
+                " les libérer (release) avant close()") from None
+        finally:
+            self._file.close()
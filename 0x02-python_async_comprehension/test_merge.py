@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests pour la fusion de flux asynchrones.
+Auteur SAID LAMGHARI
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+# L'horloge virtuelle se trouve dans le projet 0x01
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '0x01-python_async_function'))
+merge_module = __import__('5-merge')
+merge = merge_module.merge
+merge_ordered = merge_module.merge_ordered
+async_generator = __import__('0-async_generator').async_generator
+run_virtual = __import__('6-virtual_clock').run_virtual
+
+
+async def ticking(values, delay=1.0):
+    """Produit chaque valeur après delay secondes."""
+    for value in values:
+        await asyncio.sleep(delay)
+        yield value
+
+
+async def failing(after):
+    """Produit after valeurs puis lève RuntimeError."""
+    for value in range(after):
+        await asyncio.sleep(0.5)
+        yield value
+    raise RuntimeError("échec")
+
+
+def other_tasks():
+    """Retourne les tâches de la boucle autres que la tâche courante."""
+    return asyncio.all_tasks() - {asyncio.current_task()}
+
+
+class TestMerge(unittest.TestCase):
+    """
+    Classe de tests pour merge et merge_ordered.
+    """
+
+    def test_sources_run_concurrently(self):
+        """
+        Teste que quatre async_generator se terminent en 10 s de
+        temps virtuel, et non 40 s : avec merge, avec merge_ordered
+        horodaté, et avec merge_ordered sur des valeurs aléatoires
+        quand maxsize laisse chaque source prendre de l'avance.
+        """
+        for kwargs, fuse in (({}, merge),
+                             ({'stamp': True}, merge_ordered),
+                             ({'maxsize': 10}, merge_ordered)):
+            async def scenario():
+                loop = asyncio.get_running_loop()
+                values = [value async for value in fuse(
+                    *(async_generator() for _ in range(4)), **kwargs)]
+                return loop.time(), len(values)
+
+            with self.subTest(fuse=fuse.__name__, **kwargs):
+                elapsed, count = run_virtual(scenario())
+                self.assertEqual(count, 40)
+                self.assertAlmostEqual(elapsed, 10.0)
+
+    def test_merge_ordered_sorted(self):
+        """
+        Teste que merge_ordered fusionne des flux triés en un flux
+        trié, y compris avec une source vide.
+        """
+        async def scenario():
+            return [value async for value in merge_ordered(
+                ticking([1, 4, 9]), ticking([2, 3, 10], 0.3),
+                ticking([]), ticking([0, 5], 2))]
+
+        self.assertEqual(run_virtual(scenario()), [0, 1, 2, 3, 4, 5, 9, 10])
+
+    def test_merge_ordered_stamp(self):
+        """
+        Teste que stamp=True produit des couples triés par heure
+        de production.
+        """
+        async def scenario():
+            return [pair async for pair in merge_ordered(
+                ticking('ab', 1.5), ticking('xyz', 1.0), stamp=True)]
+
+        pairs = run_virtual(scenario())
+        self.assertEqual([stamp for stamp, _ in pairs],
+                         [1.0, 1.5, 2.0, 3.0, 3.0])
+        self.assertEqual(sorted(value for _, value in pairs),
+                         ['a', 'b', 'x', 'y', 'z'])
+
+    def test_failing_source(self):
+        """
+        Teste qu'une source en échec lève l'exception chez le
+        consommateur sans laisser de tâche derrière elle.
+        """
+        for fuse in (merge, merge_ordered):
+            async def scenario():
+                with self.assertRaises(RuntimeError):
+                    async for _ in fuse(failing(2), ticking(range(10))):
+                        pass
+                return other_tasks()
+
+            with self.subTest(fuse=fuse.__name__):
+                self.assertEqual(run_virtual(scenario()), set())
+
+    def test_early_close(self):
+        """
+        Teste qu'un aclose() anticipé annule les tâches de pompage
+        et ferme les sources.
+        """
+        for fuse in (merge, merge_ordered):
+            async def scenario():
+                sources = [ticking(range(100)) for _ in range(3)]
+                merged = fuse(*sources)
+                await merged.__anext__()
+                await merged.aclose()
+                closed = [source.ag_frame is None for source in sources]
+                return other_tasks(), closed
+
+            with self.subTest(fuse=fuse.__name__):
+                self.assertEqual(run_virtual(scenario()),
+                                 (set(), [True, True, True]))
+
+    def test_invalid_maxsize(self):
+        """
+        Teste que merge_ordered refuse maxsize < 1.
+        """
+        async def scenario():
+            with self.assertRaises(ValueError):
+                await merge_ordered(ticking([1]), maxsize=0).__anext__()
+
+        run_virtual(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests pour le pipeline asynchrone et async_comprehension.
+Auteur SAID LAMGHARI
+"""
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# L'horloge virtuelle se trouve dans le projet 0x01
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '0x01-python_async_function'))
+pipeline = __import__('4-pipeline')
+Pipeline = pipeline.Pipeline
+async_comprehension = __import__('1-async_comprehension').async_comprehension
+run_virtual = __import__('6-virtual_clock').run_virtual
+
+
+async def counting(count, delay=0.0):
+    """Produit 0, 1, ..., count - 1 après delay secondes chacun."""
+    for value in range(count):
+        await asyncio.sleep(delay)
+        yield value
+
+
+class RecordingQueue(asyncio.Queue):
+    """File qui retient la plus grande taille atteinte."""
+
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        """Enregistre la file créée."""
+        super().__init__(*args, **kwargs)
+        self.peak = 0
+        RecordingQueue.instances.append(self)
+
+    def put_nowait(self, item):
+        """Ajoute l'élément et met à jour la taille maximale."""
+        super().put_nowait(item)
+        self.peak = max(self.peak, self.qsize())
+
+
+class TestPipeline(unittest.TestCase):
+    """
+    Classe de tests pour Pipeline.
+    """
+
+    def test_backpressure(self):
+        """
+        Teste qu'un consommateur lent ne laisse jamais plus de
+        maxsize éléments dans une file.
+        """
+        produced = []
+
+        async def source():
+            for value in range(50):
+                produced.append(value)
+                yield value
+
+        async def slow_sink(_):
+            await asyncio.sleep(1)
+
+        RecordingQueue.instances = []
+        with patch.object(pipeline.asyncio, 'Queue', RecordingQueue):
+            run_virtual(Pipeline(source(), maxsize=3)
+                        .map(lambda x: x * 2).sink(slow_sink))
+        self.assertEqual(len(produced), 50)
+        self.assertEqual(len(RecordingQueue.instances), 2)
+        for queue in RecordingQueue.instances:
+            self.assertLessEqual(queue.peak, 3)
+
+    def test_stages_overlap(self):
+        """
+        Teste que les étapes se recouvrent dans le temps : 5 éléments
+        et trois étapes d'une seconde prennent 7 s, pas 15 s.
+        """
+        async def slow_double(value):
+            await asyncio.sleep(1)
+            return value * 2
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            seen = []
+
+            async def slow_sink(value):
+                await asyncio.sleep(1)
+                seen.append(value)
+
+            await (Pipeline(counting(5, 1), maxsize=2)
+                   .map(slow_double).sink(slow_sink))
+            return loop.time(), seen
+
+        elapsed, seen = run_virtual(scenario())
+        self.assertEqual(seen, [0, 2, 4, 6, 8])
+        self.assertAlmostEqual(elapsed, 7.0)
+
+    def test_batch_boundaries(self):
+        """
+        Teste les lots complets, le dernier lot incomplet
+        et l'absence de lot vide.
+        """
+        for count, expected in (
+                (7, [[0, 1, 2], [3, 4, 5], [6]]),
+                (6, [[0, 1, 2], [3, 4, 5]]),
+                (0, [])):
+            with self.subTest(count=count):
+                result = run_virtual(
+                    Pipeline(counting(count)).batch(3).collect())
+                self.assertEqual(result, expected)
+        with self.assertRaises(ValueError):
+            Pipeline(counting(1)).batch(0)
+
+    def test_window_boundaries(self):
+        """
+        Teste les fenêtres glissantes, avec et sans pas.
+        """
+        for count, size, step, expected in (
+                (5, 3, 1, [(0, 1, 2), (1, 2, 3), (2, 3, 4)]),
+                (6, 3, 2, [(0, 1, 2), (2, 3, 4)]),
+                (7, 3, 2, [(0, 1, 2), (2, 3, 4), (4, 5, 6)]),
+                (2, 3, 1, [])):
+            with self.subTest(count=count, size=size, step=step):
+                result = run_virtual(
+                    Pipeline(counting(count)).window(size, step).collect())
+                self.assertEqual(result, expected)
+        with self.assertRaises(ValueError):
+            Pipeline(counting(1)).window(3, 0)
+
+    def test_stage_error_cancels_everything(self):
+        """
+        Teste qu'une exception dans une étape est propagée et
+        annule toutes les autres tâches.
+        """
+        def explode(value):
+            if value == 2:
+                raise RuntimeError("échec")
+            return value
+
+        async def scenario():
+            async def forever():
+                value = 0
+                while True:
+                    await asyncio.sleep(0.1)
+                    yield value
+                    value += 1
+
+            with self.assertRaises(RuntimeError):
+                await (Pipeline(forever()).map(explode)
+                       .filter(lambda x: True).collect())
+            return asyncio.all_tasks() - {asyncio.current_task()}
+
+        self.assertEqual(run_virtual(scenario()), set())
+
+    def test_invalid_maxsize(self):
+        """
+        Teste que maxsize < 1 lève ValueError.
+        """
+        with self.assertRaises(ValueError):
+            Pipeline(counting(1), maxsize=0)
+
+
+class TestAsyncComprehension(unittest.TestCase):
+    """
+    Classe de tests pour async_comprehension.
+    """
+
+    def test_ten_values_in_ten_seconds(self):
+        """
+        Teste que async_comprehension collecte 10 valeurs
+        entre 0 et 10 en 10 secondes.
+        """
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            values = await async_comprehension()
+            return loop.time(), values
+
+        elapsed, values = run_virtual(scenario())
+        self.assertEqual(len(values), 10)
+        self.assertTrue(all(0 <= value <= 10 for value in values))
+        self.assertAlmostEqual(elapsed, 10.0)
+
+    def test_custom_source(self):
+        """
+        Teste async_comprehension avec une source fournie.
+        """
+        self.assertEqual(run_virtual(async_comprehension(counting(4))),
+                         [0, 1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests pour la lecture anticipée de générateurs asynchrones.
+Auteur SAID LAMGHARI
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+# L'horloge virtuelle se trouve dans le projet 0x01
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '0x01-python_async_function'))
+prefetch = __import__('6-prefetch').prefetch
+async_generator = __import__('0-async_generator').async_generator
+run_virtual = __import__('6-virtual_clock').run_virtual
+
+
+def other_tasks():
+    """Retourne les tâches de la boucle autres que la tâche courante."""
+    return asyncio.all_tasks() - {asyncio.current_task()}
+
+
+class TestPrefetch(unittest.TestCase):
+    """
+    Classe de tests pour prefetch.
+    """
+
+    def test_overlap(self):
+        """
+        Teste qu'un consommateur d'une seconde par valeur sur
+        async_generator prend 11 s au lieu de 20 s.
+        """
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            count = 0
+            async for _ in prefetch(async_generator()):
+                await asyncio.sleep(1)
+                count += 1
+            return loop.time(), count
+
+        self.assertEqual(run_virtual(scenario()), (11.0, 10))
+
+    def test_read_ahead_bound(self):
+        """
+        Teste qu'au plus depth + 1 valeurs sont lues d'avance.
+        """
+        for depth in (1, 3):
+            produced = []
+
+            async def source():
+                for value in range(20):
+                    produced.append(value)
+                    yield value
+
+            async def scenario():
+                ahead = 0
+                consumed = 0
+                async for _ in prefetch(source(), depth):
+                    consumed += 1
+                    await asyncio.sleep(1)
+                    ahead = max(ahead, len(produced) - consumed)
+                return ahead
+
+            with self.subTest(depth=depth):
+                self.assertEqual(run_virtual(scenario()), depth + 1)
+
+    def test_error_propagation(self):
+        """
+        Teste que l'exception de la source est relancée après les
+        valeurs déjà produites, sans laisser de tâche.
+        """
+        async def failing():
+            yield 1
+            yield 2
+            raise RuntimeError("échec")
+
+        async def scenario():
+            values = []
+            with self.assertRaises(RuntimeError):
+                async for value in prefetch(failing(), 4):
+                    values.append(value)
+            return values, other_tasks()
+
+        self.assertEqual(run_virtual(scenario()), ([1, 2], set()))
+
+    def test_cancellation(self):
+        """
+        Teste que l'annulation du consommateur pendant l'attente
+        d'une valeur annule la lecture et ferme la source.
+        """
+        async def scenario():
+            source = async_generator()
+
+            async def consume():
+                async for _ in prefetch(source):
+                    pass
+
+            task = asyncio.ensure_future(consume())
+            await asyncio.sleep(3.5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return source.ag_frame is None, other_tasks()
+
+        self.assertEqual(run_virtual(scenario()), (True, set()))
+
+    def test_aclose(self):
+        """
+        Teste qu'un aclose() anticipé ferme la source tout de suite.
+        """
+        async def scenario():
+            source = async_generator()
+            values = prefetch(source, 2)
+            await values.__anext__()
+            await values.aclose()
+            return source.ag_frame is None, other_tasks()
+
+        self.assertEqual(run_virtual(scenario()), (True, set()))
+
+    def test_break(self):
+        """
+        Teste qu'après un break, la source est fermée quand la
+        boucle finalise le générateur abandonné.
+        """
+        async def scenario():
+            source = async_generator()
+            async for _ in prefetch(source, 2):
+                break
+            await asyncio.sleep(0.1)
+            return source.ag_frame is None, other_tasks()
+
+        self.assertEqual(run_virtual(scenario()), (True, set()))
+
+    def test_invalid_depth(self):
+        """
+        Teste que depth < 1 lève ValueError.
+        """
+        async def scenario():
+            with self.assertRaises(ValueError):
+                await prefetch(async_generator(), 0).__anext__()
+
+        run_virtual(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
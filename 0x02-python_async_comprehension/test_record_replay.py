@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Tests pour l'enregistrement et la relecture de flux asynchrones.
+Auteur SAID LAMGHARI
+"""
+import asyncio
+import os
+import struct
+import sys
+import tempfile
+import unittest
+
+# L'horloge virtuelle se trouve dans le projet 0x01
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '0x01-python_async_function'))
+run_virtual = __import__('6-virtual_clock').run_virtual
+record_replay = __import__('8-record_replay')
+record = record_replay.record
+recording = record_replay.recording
+Replay = record_replay.Replay
+
+
+async def ticking(values, interval=0.01):
+    """Produit chaque valeur après interval secondes."""
+    for value in values:
+        await asyncio.sleep(interval)
+        yield value
+
+
+class TestRecordReplay(unittest.IsolatedAsyncioTestCase):
+    """
+    Classe de tests pour record, recording et Replay.
+    """
+
+    def setUp(self):
+        """Crée un dossier temporaire pour les enregistrements."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'scenario.bin')
+
+    def tearDown(self):
+        """Supprime le dossier temporaire."""
+        self.tmp.cleanup()
+
+    def write(self, data):
+        """Écrit des octets bruts dans le fichier d'enregistrement."""
+        with open(self.path, 'wb') as file:
+            file.write(data)
+
+    async def test_round_trip(self):
+        """
+        Teste qu'un flux enregistré est relu à l'identique,
+        avec ses intervalles.
+        """
+        values = [1.5, -2.25, 3.0, 0.0]
+        self.assertEqual(await record(ticking(values), self.path), 4)
+        with Replay(self.path) as replay:
+            self.assertEqual(len(replay), 4)
+            self.assertEqual(list(replay.values), values)
+            for interval in replay.intervals:
+                self.assertGreaterEqual(interval, 0.005)
+            replayed = [value async for value in
+                        replay.stream(realtime=False)]
+            self.assertEqual(replayed, values)
+            replayed = [value async for value in
+                        replay.stream(speed=10.0)]
+            self.assertEqual(replayed, values)
+
+    async def test_early_stop_finalizes_header(self):
+        """
+        Teste qu'un enregistrement interrompu reste lisible.
+        """
+        agen = recording(ticking(range(10)), self.path)
+        self.assertEqual(await agen.__anext__(), 0)
+        self.assertEqual(await agen.__anext__(), 1)
+        await agen.aclose()
+        with Replay(self.path) as replay:
+            self.assertEqual(list(replay.values), [0.0, 1.0])
+
+    async def test_invalid_files(self):
+        """
+        Teste que les fichiers invalides lèvent ValueError.
+        """
+        header = record_replay._HEADER
+        byteorder = record_replay._BYTEORDER
+        other = b'>' if byteorder == b'<' else b'<'
+        cases = [
+            b'',
+            b'AGR',
+            header.pack(b'XXXX', 1, byteorder, 0),
+            header.pack(b'AGRR', 99, byteorder, 0),
+            # Annonce deux valeurs mais n'en contient qu'une
+            header.pack(b'AGRR', 1, byteorder, 2) + struct.pack('=2d', 1, 0),
+            header.pack(b'AGRR', 1, other, 0),
+        ]
+        for data in cases:
+            self.write(data)
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    Replay(self.path)
+
+    async def test_close_with_outstanding_view(self):
+        """
+        Teste qu'une vue dérivée encore utilisée bloque close() avec
+        une BufferError claire, sans laisser le fichier ouvert.
+        """
+        await record(ticking([1.0, 2.0, 3.0, 4.0], 0), self.path)
+        replay = Replay(self.path)
+        head = replay.values[:3]
+        self.assertEqual(list(head), [1.0, 2.0, 3.0])
+        with self.assertRaises(BufferError):
+            replay.close()
+        self.assertTrue(replay._file.closed)
+        with self.assertRaises(BufferError):
+            replay.close()
+        head.release()
+        replay.close()
+        self.assertTrue(replay._map.closed)
+        replay.close()
+
+    async def test_fast_replay_yields_to_loop(self):
+        """
+        Teste que la relecture sans attente laisse tourner
+        les autres tâches.
+        """
+        count = 3 * record_replay._YIELD_EVERY
+        await record(ticking(range(count), 0), self.path)
+        ticks = 0
+
+        async def other():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(other())
+        await asyncio.sleep(0)
+        ticks = 0
+        with Replay(self.path) as replay:
+            replayed = [value async for value in
+                        replay.stream(realtime=False)]
+        task.cancel()
+        self.assertEqual(len(replayed), count)
+        self.assertGreaterEqual(ticks, 2)
+
+
+class TestRealtimeReplay(unittest.TestCase):
+    """
+    Classe de tests pour la relecture au rythme d'origine.
+    """
+
+    def setUp(self):
+        """Enregistre 100 valeurs espacées de 0.5 s (horloge virtuelle)."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'scenario.bin')
+        run_virtual(record(ticking(range(100), 0.5), self.path))
+
+    def tearDown(self):
+        """Supprime le dossier temporaire."""
+        self.tmp.cleanup()
+
+    def replay_duration(self, speed, work):
+        """
+        Rejoue l'enregistrement avec un consommateur qui travaille
+        work secondes par valeur et retourne la durée totale.
+        """
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            with Replay(self.path) as replay:
+                async for _ in replay.stream(speed=speed):
+                    await asyncio.sleep(work)
+            return loop.time() - start
+
+        return run_virtual(scenario())
+
+    def test_original_pace(self):
+        """
+        Teste que la durée totale suit l'enregistrement (50 s) et
+        que le travail du consommateur ne s'accumule pas.
+        """
+        self.assertAlmostEqual(self.replay_duration(1.0, 0), 50.0)
+        self.assertAlmostEqual(self.replay_duration(1.0, 0.2), 50.2)
+
+    def test_speed(self):
+        """
+        Teste le facteur d'accélération.
+        """
+        self.assertAlmostEqual(self.replay_duration(4.0, 0.1), 12.6)
+
+    def test_invalid_speed(self):
+        """
+        Teste que speed <= 0 lève ValueError.
+        """
+        async def scenario(speed):
+            with Replay(self.path) as replay:
+                with self.assertRaises(ValueError):
+                    await replay.stream(speed=speed).__anext__()
+
+        for speed in (0, -1.0):
+            with self.subTest(speed=speed):
+                run_virtual(scenario(speed))
+
+
+if __name__ == '__main__':
+    unittest.main()
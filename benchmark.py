@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks pour les projets 0x00, 0x01 et 0x02.
+
+Chaque benchmark est mesuré avec time.perf_counter_ns, après des
+itérations de chauffe, sur plusieurs répétitions. Les coroutines
+d'un même benchmark partagent une seule boucle d'événements afin
+de ne pas mesurer la création de la boucle.
+
+Le rapport JSON a un format stable (clés triées, champ "schema")
+pour comparer deux versions ou deux stratégies d'ordonnancement.
+
+Utilisation :
+    ./benchmark.py --repeat 30 --warmup 3 --output resultats.json
+    ./benchmark.py --filter 'wait_n' --n 1000 --max-delay 0.01
+    ./benchmark.py --virtual-clock --filter async_comprehension
+    ./benchmark.py --loop uvloop --filter 'wait_n'
+
+Auteur SAID LAMGHARI
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECTS = (
+    '0x00-python_variable_annotations',
+    '0x01-python_async_function',
+    '0x02-python_async_comprehension',
+)
+for project in PROJECTS:
+    sys.path.insert(0, os.path.join(BASE_DIR, project))
+
+# Version du format JSON, à incrémenter si les clés changent
+SCHEMA_VERSION = 1
+
+# Benchmarks qui dorment vraiment (10 secondes par exécution pour
+# async_comprehension) : lancés seulement avec l'horloge virtuelle
+# ou si --filter les désigne
+SLOW_BENCHMARKS = frozenset({'0x02.async_comprehension'})
+
+
+def percentile(sorted_samples: Sequence[float], pct: float) -> float:
+    """
+    Calcule un percentile par interpolation linéaire.
+
+    Args:
+        sorted_samples (Sequence[float]): Échantillons triés, non vides.
+        pct (float): Percentile voulu, entre 0 et 100.
+
+    Returns:
+        float: La valeur du percentile.
+    """
+    rank = (len(sorted_samples) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return float(sorted_samples[low])
+    weight = rank - low
+    return (sorted_samples[low] * (1 - weight)
+            + sorted_samples[high] * weight)
+
+
+def summarize(samples_ns: Sequence[float]) -> Dict[str, float]:
+    """
+    Résume une série de mesures en nanosecondes.
+
+    Args:
+        samples_ns (Sequence[float]): Durées mesurées, en nanosecondes.
+
+    Returns:
+        Dict[str, float]: min, max, moyenne, médiane,
+        écart-type, p95 et p99.
+    """
+    ordered = sorted(samples_ns)
+    return {
+        'min': float(ordered[0]),
+        'max': float(ordered[-1]),
+        'mean': statistics.mean(ordered),
+        'median': statistics.median(ordered),
+        'stdev': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        'p95': percentile(ordered, 95),
+        'p99': percentile(ordered, 99),
+    }
+
+
+def bench_sync(func: Callable[[], Any], repeat: int, warmup: int,
+               inner: int) -> List[float]:
+    """
+    Mesure une fonction synchrone.
+
+    Chaque échantillon exécute la fonction inner fois et
+    rapporte la durée moyenne d'un appel.
+
+    Args:
+        func (Callable): Fonction sans argument à mesurer.
+        repeat (int): Nombre d'échantillons conservés.
+        warmup (int): Nombre d'échantillons de chauffe ignorés.
+        inner (int): Nombre d'appels par échantillon.
+
+    Returns:
+        List[float]: Durée d'un appel, en nanosecondes, par échantillon.
+    """
+    samples = []
+    calls = range(inner)
+    for index in range(warmup + repeat):
+        start = time.perf_counter_ns()
+        for _ in calls:
+            func()
+        elapsed = time.perf_counter_ns() - start
+        if index >= warmup:
+            samples.append(elapsed / inner)
+    return samples
+
+
+def bench_async(factory: Callable[[], Awaitable[Any]], repeat: int,
+                warmup: int,
+                loop_factory: Callable[[], asyncio.AbstractEventLoop]
+                = asyncio.new_event_loop) -> List[float]:
+    """
+    Mesure une coroutine sur une seule boucle d'événements.
+
+    Args:
+        factory (Callable): Fonction sans argument retournant
+        la coroutine à mesurer.
+        repeat (int): Nombre d'échantillons conservés.
+        warmup (int): Nombre d'échantillons de chauffe ignorés.
+        loop_factory (Callable): Fabrique de la boucle d'événements.
+
+    Returns:
+        List[float]: Durée de chaque exécution, en nanosecondes.
+    """
+    samples = []
+    loop = loop_factory()
+    try:
+        for index in range(warmup + repeat):
+            start = time.perf_counter_ns()
+            loop.run_until_complete(factory())
+            elapsed = time.perf_counter_ns() - start
+            if index >= warmup:
+                samples.append(float(elapsed))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+    return samples
+
+
+def default_benchmarks(n: int, max_delay: float,
+                       max_in_flight: int) -> List[Tuple[str, str, Any]]:
+    """
+    Construit la liste des benchmarks disponibles.
+
+    Args:
+        n (int): Nombre de coroutines pour wait_n et task_wait_n.
+        max_delay (float): Délai maximum passé à wait_random.
+        max_in_flight (int): Limite de concurrence du mode borné.
+
+    Returns:
+        List[Tuple[str, str, Any]]: Triplets (nom, type, appelable),
+        le type valant "sync" ou "async".
+    """
+    add = __import__('0-add').add
+    concat = __import__('1-concat').concat
+    floor = __import__('2-floor').floor
+    to_str = __import__('3-to_str').to_str
+    sum_list = __import__('5-sum_list').sum_list
+    sum_mixed_list = __import__('6-sum_mixed_list').sum_mixed_list
+    to_kv = __import__('7-to_kv').to_kv
+    make_multiplier = __import__('8-make_multiplier').make_multiplier
+    element_length = __import__('9-element_length').element_length
+    safe_first_element = __import__(
+        '100-safe_first_element').safe_first_element
+    safely_get_value = __import__('101-safely_get_value').safely_get_value
+    zoom_array = __import__('102-type_checking').zoom_array
+    wait_n = __import__('1-concurrent_coroutines').wait_n
+    task_wait_n = __import__('4-tasks').task_wait_n
+    async_comprehension = __import__(
+        '1-async_comprehension').async_comprehension
+
+    floats = [3.14, 1.11, 2.22] * 10
+    mixed = [5, 4, 3.14, 666, 0.99] * 10
+    words = ['egg', 'shell', 'holberton'] * 10
+    mapping = {'key': 1}
+    multiplier = make_multiplier(2.22)
+    return [
+        ('0x00.add', 'sync', lambda: add(1.11, 2.22)),
+        ('0x00.concat', 'sync', lambda: concat('egg', 'shell')),
+        ('0x00.floor', 'sync', lambda: floor(3.14)),
+        ('0x00.to_str', 'sync', lambda: to_str(3.14)),
+        ('0x00.sum_list', 'sync', lambda: sum_list(floats)),
+        ('0x00.sum_mixed_list', 'sync', lambda: sum_mixed_list(mixed)),
+        ('0x00.to_kv', 'sync', lambda: to_kv('eggs', 3)),
+        ('0x00.make_multiplier', 'sync', lambda: multiplier(3.0)),
+        ('0x00.element_length', 'sync', lambda: element_length(words)),
+        ('0x00.safe_first_element', 'sync',
+         lambda: safe_first_element(words)),
+        ('0x00.safely_get_value', 'sync',
+         lambda: safely_get_value(mapping, 'key')),
+        ('0x00.zoom_array', 'sync', lambda: zoom_array((12, 72, 91), 3)),
+        ('0x01.wait_n', 'async', lambda: wait_n(n, max_delay)),
+        ('0x01.wait_n[bounded]', 'async',
+         lambda: wait_n(n, max_delay, max_in_flight)),
+        ('0x01.task_wait_n', 'async', lambda: task_wait_n(n, max_delay)),
+        ('0x01.task_wait_n[bounded]', 'async',
+         lambda: task_wait_n(n, max_delay, max_in_flight)),
+        ('0x02.async_comprehension', 'async', async_comprehension),
+    ]
+
+
+def run(args: argparse.Namespace, loop_name: str,
+        loop_factory: Callable[[], asyncio.AbstractEventLoop]
+        ) -> Dict[str, Any]:
+    """
+    Exécute les benchmarks sélectionnés et construit le rapport.
+
+    Args:
+        args (argparse.Namespace): Options de la ligne de commande.
+        loop_name (str): Nom de la boucle d'événements utilisée.
+        loop_factory (Callable): Fabrique de cette boucle.
+
+    Returns:
+        Dict[str, Any]: Le rapport, prêt à être sérialisé en JSON.
+    """
+    pattern = re.compile(args.filter)
+    # Avec l'horloge virtuelle, les sommeils ne coûtent que du temps CPU
+    run_slow = loop_name == 'virtual'
+    results = []
+    for name, kind, func in default_benchmarks(
+            args.n, args.max_delay, args.max_in_flight):
+        if not pattern.search(name):
+            continue
+        if name in SLOW_BENCHMARKS and not (run_slow or args.filter):
+            continue
+        if kind == 'sync':
+            samples = bench_sync(func, args.repeat, args.warmup, args.inner)
+        else:
+            samples = bench_async(func, args.repeat, args.warmup,
+                                  loop_factory)
+        result = {'name': name, 'kind': kind, 'unit': 'ns',
+                  'repeat': args.repeat, 'warmup': args.warmup}
+        result.update(summarize(samples))
+        results.append(result)
+    return {
+        'schema': SCHEMA_VERSION,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'params': {'n': args.n, 'max_delay': args.max_delay,
+                   'max_in_flight': args.max_in_flight,
+                   'inner': args.inner,
+                   'loop': loop_name},
+        'results': results,
+    }
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """
+    Point d'entrée de la ligne de commande.
+
+    Args:
+        argv (Sequence[str]): Arguments, sys.argv[1:] par défaut.
+
+    Returns:
+        int: Code de sortie du programme.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--inner', type=int, default=1000,
+                        help="appels par échantillon (benchmarks sync)")
+    parser.add_argument('--n', type=int, default=100)
+    parser.add_argument('--max-delay', type=float, default=0.01)
+    parser.add_argument('--max-in-flight', type=int, default=10)
+    parser.add_argument('--loop', default='asyncio',
+                        help="boucle : asyncio, uvloop ou virtual")
+    parser.add_argument('--virtual-clock', action='store_true',
+                        help="équivalent de --loop virtual")
+    parser.add_argument('--filter', default='',
+                        help="expression régulière sur le nom")
+    parser.add_argument('--output', help="fichier JSON (stdout sinon)")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat doit être supérieur ou égal à 1")
+    loop_name = 'virtual' if args.virtual_clock else args.loop
+    try:
+        loop_factory = __import__('11-loop_runner').get_loop_factory(
+            loop_name)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    report = json.dumps(run(args, loop_name, loop_factory),
+                        indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report + '\n')
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())